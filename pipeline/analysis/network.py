@@ -11,12 +11,37 @@ computes centrality metrics, and answers the "deeper questions":
 
 from __future__ import annotations
 
+import copy
+import functools
+import heapq
+import itertools
 import logging
+import math
+import os
+import sys
 from collections import Counter, defaultdict
 from dataclasses import dataclass, field
+from multiprocessing import Pool
+from typing import Any
 
 import networkx as nx
 
+try:  # optional C backend for betweenness
+    import igraph as ig
+except ImportError:  # pragma: no cover
+    ig = None
+
+try:  # optional OpenMP backend for betweenness
+    import networkit as nk
+except ImportError:  # pragma: no cover
+    nk = None
+
+try:  # optional sparse backend for structural metrics
+    from scipy.sparse import csr_array
+    from scipy.sparse.csgraph import connected_components
+except ImportError:  # pragma: no cover
+    csr_array = None
+
 from pipeline.models.schema import (
     Company,
     Founder,
@@ -26,8 +51,110 @@ from pipeline.models.schema import (
 
 log = logging.getLogger(__name__)
 
+# Below this many nodes betweenness runs serially — forking a worker pool
+# costs more than the Brandes pass itself on small sectors.
+PARALLEL_MIN_NODES = 500
+
+# Minimum number of BFS sources sampled when betweenness is approximated
+# (Bader/Kintali estimator).  Graphs with fewer nodes are always exact.
+APPROX_MIN_SAMPLES = 200
+
+# Betweenness backends NetworkAnalyser accepts; "auto" picks the fastest
+# one installed (igraph, then networkit, then numba/NetworkX).
+GRAPH_BACKENDS = ("auto", "networkx", "igraph", "networkit")
+
+# Above this many nodes clusters come from linear-time label propagation
+# instead of greedy modularity maximisation.
+LABEL_PROPAGATION_MIN_NODES = 10_000
+
+
+def _chunks(iterable, n: int):
+    """Yield successive tuples of *n* items from *iterable*."""
+    it = iter(iterable)
+    while True:
+        chunk = tuple(itertools.islice(it, n))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _betweenness_parallel(
+    graph: nx.Graph,
+    processes: int | None = None,
+    weight: str | None = None,
+) -> dict[str, float]:
+    """
+    Map-reduce betweenness centrality over a process pool.
+
+    Source nodes are split into ``processes * 4`` chunks; each worker runs
+    Brandes from its chunk of sources to every target, and the partial
+    scores are summed.  Matches ``nx.betweenness_centrality`` exactly.
+    """
+    with Pool(processes=processes) as pool:
+        node_divisor = len(pool._pool) * 4
+        node_chunks = list(_chunks(graph.nodes(), max(1, graph.order() // node_divisor)))
+        num_chunks = len(node_chunks)
+        partials = pool.starmap(
+            nx.betweenness_centrality_subset,
+            zip(
+                [graph] * num_chunks,
+                node_chunks,
+                [list(graph)] * num_chunks,
+                [True] * num_chunks,
+                [weight] * num_chunks,
+            ),
+        )
 
-@dataclass
+    bc = partials[0]
+    for partial in partials[1:]:
+        for node, score in partial.items():
+            bc[node] += score
+    return bc
+
+
+def _betweenness_igraph(graph: nx.Graph, weight: str | None = None) -> dict[str, float]:
+    """
+    Betweenness centrality via igraph's C implementation.
+
+    Scores are rescaled to match ``nx.betweenness_centrality``'s
+    normalisation for undirected graphs.
+    """
+    nodes = list(graph)
+    idx = {node: i for i, node in enumerate(nodes)}
+    g = ig.Graph(
+        n=len(nodes),
+        edges=[(idx[a], idx[b]) for a, b in graph.edges()],
+        directed=False,
+    )
+    if weight is not None:
+        g.es["weight"] = [d.get(weight, 1.0) for _, _, d in graph.edges(data=True)]
+    scores = g.betweenness(weights="weight" if weight is not None else None)
+    n = len(nodes)
+    scale = 2.0 / ((n - 1) * (n - 2)) if n > 2 else 1.0
+    return {node: score * scale for node, score in zip(nodes, scores)}
+
+
+def _betweenness_networkit(graph: nx.Graph, weight: str | None = None) -> dict[str, float]:
+    """
+    Betweenness centrality via networkit's OpenMP-parallel Brandes.
+
+    networkit's normalised scores already match ``nx.betweenness_centrality``.
+    """
+    nodes = list(graph)
+    idx = {node: i for i, node in enumerate(nodes)}
+    g = nk.Graph(len(nodes), weighted=weight is not None)
+    if weight is not None:
+        for a, b, w in graph.edges(data=weight, default=1.0):
+            g.addEdge(idx[a], idx[b], w)
+    else:
+        for a, b in graph.edges():
+            g.addEdge(idx[a], idx[b])
+    bc = nk.centrality.Betweenness(g, normalized=True)
+    bc.run()
+    return dict(zip(nodes, bc.scores()))
+
+
+@dataclass(slots=True)
 class NetworkInsight:
     """A single insight produced by the analysis engine."""
     category: str  # e.g. "education_hub", "employer_pipeline", "cluster"
@@ -37,6 +164,69 @@ class NetworkInsight:
     entities: list[str] = field(default_factory=list)
 
 
+def _norm(text: str) -> str:
+    """Strip and intern an institution/employer name so repeats share one object."""
+    return sys.intern(text.strip())
+
+
+def _pair_key(a: str, b: str) -> tuple[str, str]:
+    """Order-independent key for an undirected founder pair."""
+    return (a, b) if a < b else (b, a)
+
+
+def _accumulate(
+    pairs: dict[tuple[str, str], list],
+    a: str,
+    b: str,
+    weight: float,
+    rel: RelationshipType,
+    ctx: str,
+) -> None:
+    """Add *weight* to the pair's running total, keeping the first relation."""
+    key = _pair_key(a, b)
+    entry = pairs.get(key)
+    if entry is None:
+        pairs[key] = [weight, rel, ctx]
+    else:
+        entry[0] += weight
+
+
+def _memoized(method=None, *, bypass: tuple[str, ...] = ()):
+    """
+    Cache an analysis method's result on the instance, keyed by the method
+    name and its arguments.  ``build_graph`` clears the cache.  Each call
+    gets its own deep copy, so callers may sort or edit what they receive.
+
+    Calls that pass any keyword named in *bypass* (precomputed inputs) are
+    not cached.
+    """
+    if method is None:
+        return functools.partial(_memoized, bypass=bypass)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if any(kwargs.get(name) is not None for name in bypass):
+            return method(self, *args, **kwargs)
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        try:
+            result = self._cache[key]
+        except KeyError:
+            result = self._cache[key] = method(self, *args, **kwargs)
+        return copy.deepcopy(result)
+
+    return wrapper
+
+
+@functools.cache
+def _numba_brandes():
+    """The JIT Brandes kernel, or None without numba (imported on first use)."""
+    try:
+        from pipeline.analysis._brandes_numba import brandes
+    except ImportError:
+        return None
+    return brandes
+
+
 class NetworkAnalyser:
     """Build and analyse the founder network graph."""
 
@@ -44,23 +234,70 @@ class NetworkAnalyser:
         self,
         companies: list[Company],
         founders: list[Founder],
+        processes: int | None = None,
+        exact_centrality: bool = False,
+        backend: str = "auto",
     ):
+        if backend not in GRAPH_BACKENDS:
+            raise ValueError(f"Unknown graph backend {backend!r}; expected one of {GRAPH_BACKENDS}")
+        if (backend == "igraph" and ig is None) or (backend == "networkit" and nk is None):
+            raise ImportError(f"Graph backend {backend!r} is not installed")
         self.companies = {c.id: c for c in companies}
         self.founders = {f.id: f for f in founders}
-        self.graph = nx.Graph()
+        self.processes = processes or os.cpu_count() or 1
+        # Default for centrality_rankings(exact=None)
+        self.exact_centrality = exact_centrality
+        # Which library scores betweenness (see GRAPH_BACKENDS)
+        self.backend = backend
+        # Normalised institution / employer names per founder, walked once
+        # here and reused by every analysis below.
+        self._edu_per_founder: dict[str, list[str]] = {}
+        self._work_per_founder: dict[str, list[str]] = {}
+        # Institutions + employers + founded companies, for cluster labels
+        self._founder_contexts: dict[str, Counter[str]] = {}
+        for fid, f in self.founders.items():
+            institutions = [
+                inst for inst in (_norm(ed.institution) for ed in f.education) if inst
+            ]
+            employers = [
+                emp for emp in (_norm(w.company) for w in f.work_history)
+                if emp and emp != "—"
+            ]
+            self._edu_per_founder[fid] = institutions
+            self._work_per_founder[fid] = employers
+            self._founder_contexts[fid] = Counter(
+                institutions
+                + employers
+                + [self.companies[cid].name for cid in f.companies if cid in self.companies]
+            )
+        # Built on first use of .graph (or an explicit build_graph() call);
+        # the count-based analyses never need it.
+        self._graph = nx.Graph()
+        self._built = False
         self.edges: list[NetworkEdge] = []
+        self._cache: dict[tuple, Any] = {}
+        # CSR adjacency (scipy only) and the node id for each row
+        self._csr = None
+        self._csr_nodes: list[str] = []
 
     # ------------------------------------------------------------------
     # Graph construction
     # ------------------------------------------------------------------
 
+    @property
+    def graph(self) -> nx.Graph:
+        """The founder network, built on first access."""
+        if not self._built:
+            self.build_graph()
+        return self._graph
+
     def build_graph(self) -> nx.Graph:
         """Construct the full network graph from founders + companies."""
-        # Add founder nodes
-        for fid, f in self.founders.items():
-            attrs = f.model_dump()
-            attrs.pop("id", None)
-            self.graph.add_node(fid, node_type="founder", **attrs)
+        self._built = True
+        self._cache.clear()
+
+        # Add founder nodes — records stay in self.founders, keyed by node id
+        self.graph.add_nodes_from(self.founders.keys(), node_type="founder")
 
         # 1. Co-founder edges (same company)
         company_founders: dict[str, list[str]] = defaultdict(list)
@@ -68,72 +305,42 @@ class NetworkAnalyser:
             for cid in f.companies:
                 company_founders[cid].append(fid)
 
+        # Every relation accumulates into one pair -> [weight, rel, ctx] map
+        # that is handed to NetworkX in a single bulk insert at the end.
+        pairs: dict[tuple[str, str], list] = {}
         for cid, fids in company_founders.items():
-            for i, a in enumerate(fids):
-                for b in fids[i + 1 :]:
-                    edge = NetworkEdge(
-                        source_id=a,
-                        target_id=b,
-                        relationship=RelationshipType.CO_FOUNDER,
-                        weight=3.0,
-                        context=self.companies.get(cid, Company(id=cid, name=cid)).name,
-                    )
-                    self.edges.append(edge)
-                    self.graph.add_edge(a, b, weight=3.0, rel="co_founder", ctx=cid)
+            for a, b in itertools.combinations(fids, 2):
+                # Co-founding twice doesn't strengthen the tie; last company wins
+                pairs[_pair_key(a, b)] = [3.0, RelationshipType.CO_FOUNDER, cid]
 
         # 2. Same-college edges
         institution_map: dict[str, list[str]] = defaultdict(list)
-        for fid, f in self.founders.items():
-            for ed in f.education:
-                # Normalise institution name
-                inst = ed.institution.strip()
-                if inst:
-                    institution_map[inst].append(fid)
+        for fid, institutions in self._edu_per_founder.items():
+            for inst in institutions:
+                institution_map[inst].append(fid)
 
         for inst, fids in institution_map.items():
-            unique = list(set(fids))
-            for i, a in enumerate(unique):
-                for b in unique[i + 1 :]:
-                    # Don't double-count if already co-founders
-                    if self.graph.has_edge(a, b):
-                        self.graph[a][b]["weight"] += 1.0
-                    else:
-                        self.graph.add_edge(a, b, weight=1.0, rel="same_college", ctx=inst)
-                    self.edges.append(
-                        NetworkEdge(
-                            source_id=a,
-                            target_id=b,
-                            relationship=RelationshipType.SAME_COLLEGE,
-                            weight=1.0,
-                            context=inst,
-                        )
-                    )
+            for a, b in itertools.combinations(list(set(fids)), 2):
+                _accumulate(pairs, a, b, 1.0, RelationshipType.SAME_COLLEGE, inst)
 
         # 3. Same-employer edges
         employer_map: dict[str, list[str]] = defaultdict(list)
-        for fid, f in self.founders.items():
-            for w in f.work_history:
-                emp = w.company.strip()
-                if emp and emp != "—":
-                    employer_map[emp].append(fid)
+        for fid, employers in self._work_per_founder.items():
+            for emp in employers:
+                employer_map[emp].append(fid)
 
         for emp, fids in employer_map.items():
-            unique = list(set(fids))
-            for i, a in enumerate(unique):
-                for b in unique[i + 1 :]:
-                    if self.graph.has_edge(a, b):
-                        self.graph[a][b]["weight"] += 1.5
-                    else:
-                        self.graph.add_edge(a, b, weight=1.5, rel="same_employer", ctx=emp)
-                    self.edges.append(
-                        NetworkEdge(
-                            source_id=a,
-                            target_id=b,
-                            relationship=RelationshipType.SAME_EMPLOYER,
-                            weight=1.5,
-                            context=emp,
-                        )
-                    )
+            for a, b in itertools.combinations(list(set(fids)), 2):
+                _accumulate(pairs, a, b, 1.5, RelationshipType.SAME_EMPLOYER, emp)
+
+        self.graph.add_edges_from(
+            (a, b, {"weight": weight, "rel": rel.value, "ctx": ctx})
+            for (a, b), (weight, rel, ctx) in pairs.items()
+        )
+
+        self.edges = self._collect_edges()
+        if csr_array is not None:
+            self._build_csr()
 
         log.info(
             "Graph built: %d nodes, %d edges",
@@ -142,44 +349,117 @@ class NetworkAnalyser:
         )
         return self.graph
 
+    def _build_csr(self) -> None:
+        """Snapshot the weighted graph as a symmetric scipy CSR array."""
+        nodes = list(self.graph)
+        idx = {fid: i for i, fid in enumerate(nodes)}
+        rows: list[int] = []
+        cols: list[int] = []
+        data: list[float] = []
+        for a, b, weight in self.graph.edges(data="weight"):
+            i, j = idx[a], idx[b]
+            rows += (i, j)
+            cols += (j, i)
+            data += (weight, weight)
+        n = len(nodes)
+        self._csr = csr_array((data, (rows, cols)), shape=(n, n))
+        self._csr_nodes = nodes
+
+    def _csr_arrays(self) -> tuple[Any, Any, Any, list[str]]:
+        """``(indptr, indices, weights, nodes)`` of the weighted adjacency."""
+        if self._csr is not None:
+            csr = self._csr
+            return csr.indptr, csr.indices, csr.data, self._csr_nodes
+        import numpy as np
+
+        nodes = list(self.graph)
+        idx = {fid: i for i, fid in enumerate(nodes)}
+        adj = self.graph.adj
+        indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+        np.cumsum([len(adj[fid]) for fid in nodes], out=indptr[1:])
+        indices = np.fromiter(
+            (idx[nbr] for fid in nodes for nbr in adj[fid]),
+            dtype=np.int64, count=indptr[-1],
+        )
+        weights = np.fromiter(
+            (d["weight"] for fid in nodes for d in adj[fid].values()),
+            dtype=np.float64, count=indptr[-1],
+        )
+        return indptr, indices, weights, nodes
+
+    def _components(self) -> list[set[str]]:
+        """Connected components, via the CSR adjacency when available."""
+        if self._csr is None:
+            return list(nx.connected_components(self.graph))
+        n_components, labels = connected_components(self._csr, directed=False)
+        components: list[set[str]] = [set() for _ in range(n_components)]
+        for node, label in zip(self._csr_nodes, labels):
+            components[label].add(node)
+        return components
+
+    def _collect_edges(self) -> list[NetworkEdge]:
+        """
+        One NetworkEdge per connected founder pair, mirroring the graph:
+        the first relation that linked the pair plus the combined weight.
+        """
+        edges = []
+        for a, b, data in self.graph.edges(data=True):
+            ctx = data["ctx"]
+            if data["rel"] == RelationshipType.CO_FOUNDER.value:
+                company = self.companies.get(ctx)
+                ctx = company.name if company else ctx
+            edges.append(
+                NetworkEdge(
+                    source_id=a,
+                    target_id=b,
+                    relationship=RelationshipType(data["rel"]),
+                    weight=data["weight"],
+                    context=ctx,
+                )
+            )
+        return edges
+
     # ------------------------------------------------------------------
     # Analysis methods
     # ------------------------------------------------------------------
 
+    @_memoized
     def education_hubs(self, top_n: int = 15) -> list[dict]:
         """Rank institutions by number of founders produced."""
         counter: Counter[str] = Counter()
-        for f in self.founders.values():
-            for ed in f.education:
-                if ed.institution.strip():
-                    counter[ed.institution.strip()] += 1
+        for institutions in self._edu_per_founder.values():
+            counter.update(institutions)
         return [
             {"institution": inst, "founder_count": count}
             for inst, count in counter.most_common(top_n)
         ]
 
+    @_memoized
     def employer_pipelines(self, top_n: int = 15) -> list[dict]:
         """Rank prior employers by number of founders they spawned."""
         counter: Counter[str] = Counter()
-        for f in self.founders.values():
-            for w in f.work_history:
-                emp = w.company.strip()
-                if emp and emp != "—":
-                    counter[emp] += 1
+        for employers in self._work_per_founder.values():
+            counter.update(employers)
         return [
             {"employer": emp, "founder_count": count}
             for emp, count in counter.most_common(top_n)
         ]
 
-    def centrality_rankings(self, top_n: int = 20) -> list[dict]:
+    @_memoized
+    def centrality_rankings(self, top_n: int = 20, exact: bool | None = None) -> list[dict]:
         """
         Rank founders by betweenness centrality — identifies founders
         who bridge multiple networks (the "connectors").
+
+        On the NetworkX backend large graphs are scored from a sample of
+        ``max(200, sqrt(n))`` source nodes rather than all of them — ample
+        for a top-N ranking.  Pass ``exact=True`` to force full Brandes;
+        ``None`` uses the analyser's ``exact_centrality`` setting.
         """
         if not self.graph.edges:
             return []
-        bc = nx.betweenness_centrality(self.graph, weight="weight")
-        ranked = sorted(bc.items(), key=lambda x: x[1], reverse=True)[:top_n]
+        bc = self._betweenness(self.exact_centrality if exact is None else exact)
+        ranked = heapq.nlargest(top_n, bc.items(), key=lambda x: x[1])
         return [
             {
                 "founder_id": fid,
@@ -189,15 +469,43 @@ class NetworkAnalyser:
             for fid, score in ranked
         ]
 
+    @_memoized
+    def _betweenness(self, exact: bool) -> dict[str, float]:
+        """Betweenness for every node — shared by all ``top_n`` rankings."""
+        n = self.graph.number_of_nodes()
+        k = max(APPROX_MIN_SAMPLES, math.isqrt(n))
+        backend = self.backend
+        if backend == "igraph" or (backend == "auto" and ig is not None):
+            return _betweenness_igraph(self.graph, weight="weight")
+        if backend == "networkit" or (backend == "auto" and nk is not None):
+            return _betweenness_networkit(self.graph, weight="weight")
+        if backend == "auto" and n >= PARALLEL_MIN_NODES and _numba_brandes() is not None:
+            indptr, indices, weights, nodes = self._csr_arrays()
+            return dict(zip(nodes, _numba_brandes()(indptr, indices, weights).tolist()))
+        if not exact and k < n:
+            return nx.betweenness_centrality(self.graph, k=k, seed=42, weight="weight")
+        if self.processes > 1 and n >= PARALLEL_MIN_NODES:
+            return _betweenness_parallel(self.graph, self.processes, weight="weight")
+        return nx.betweenness_centrality(self.graph, weight="weight")
+
+    @_memoized
     def detect_clusters(self, min_size: int = 3) -> list[dict]:
         """
         Detect tightly connected founder clusters using community detection.
         These are potential "mafias" — groups with overlapping education,
         employers, or co-founding history.
         """
-        if not self.graph.edges:
+        # A cluster of min_size founders needs at least min_size - 1 edges
+        if not self.graph.edges or self.graph.number_of_edges() < min_size - 1:
             return []
-        communities = nx.community.greedy_modularity_communities(self.graph)
+        components = self._components()
+        if self.graph.number_of_edges() == self.graph.number_of_nodes() - len(components):
+            # A forest: modularity adds nothing — its trees are the clusters
+            communities = components
+        elif self.graph.number_of_nodes() >= LABEL_PROPAGATION_MIN_NODES:
+            communities = list(nx.community.label_propagation_communities(self.graph))
+        else:
+            communities = nx.community.greedy_modularity_communities(self.graph)
         clusters = []
         for i, community in enumerate(communities):
             if len(community) < min_size:
@@ -206,16 +514,8 @@ class NetworkAnalyser:
             # Determine the dominant shared context
             contexts: Counter[str] = Counter()
             for fid in members:
-                if fid in self.founders:
-                    f = self.founders[fid]
-                    for ed in f.education:
-                        contexts[ed.institution] += 1
-                    for w in f.work_history:
-                        contexts[w.company] += 1
-                    for cid in f.companies:
-                        c = self.companies.get(cid)
-                        if c:
-                            contexts[c.name] += 1
+                if fid in self._founder_contexts:
+                    contexts.update(self._founder_contexts[fid])
 
             top_context = contexts.most_common(3)
             clusters.append({
@@ -231,19 +531,26 @@ class NetworkAnalyser:
             })
         return sorted(clusters, key=lambda c: c["size"], reverse=True)
 
-    def founder_to_company_flow(self) -> list[dict]:
+    @_memoized
+    def founder_to_company_flow(self, top_n: int | None = None) -> list[dict]:
         """
         Trace employer → founded-company pipelines.
         e.g. "Flipkart → PhonePe (4 founders)"
+
+        Returns every flow with 2+ founders, or only the *top_n* largest.
         """
         flows: dict[tuple[str, str], list[str]] = defaultdict(list)
         for fid, f in self.founders.items():
-            employers = {w.company.strip() for w in f.work_history if w.company.strip() != "—"}
-            founded = set(f.companies)
-            for emp in employers:
-                for comp_id in founded:
-                    c = self.companies.get(comp_id)
-                    comp_name = c.name if c else comp_id
+            employers = self._work_per_founder[fid]
+            if not employers or not f.companies:
+                continue
+            # Resolve company names once per founder, not once per employer
+            founded = []
+            for comp_id in dict.fromkeys(f.companies):
+                c = self.companies.get(comp_id)
+                founded.append(c.name if c else comp_id)
+            for emp in dict.fromkeys(employers):
+                for comp_name in founded:
                     flows[(emp, comp_name)].append(f.name)
 
         results = [
@@ -256,8 +563,11 @@ class NetworkAnalyser:
             for (emp, comp), names in flows.items()
             if len(names) >= 2
         ]
+        if top_n is not None:
+            return heapq.nlargest(top_n, results, key=lambda r: r["count"])
         return sorted(results, key=lambda r: r["count"], reverse=True)
 
+    @_memoized
     def geographic_distribution(self) -> list[dict]:
         """City-level distribution of companies."""
         counter: Counter[str] = Counter()
@@ -274,15 +584,42 @@ class NetworkAnalyser:
             for city, count in counter.most_common()
         ]
 
-    def generate_insights(self) -> list[NetworkInsight]:
-        """Run all analyses and produce a list of ranked insights."""
-        insights: list[NetworkInsight] = []
+    @_memoized(bypass=("edu_hubs", "employer_pipes", "centrality", "clusters", "flows"))
+    def generate_insights(
+        self,
+        *,
+        edu_hubs: list[dict] | None = None,
+        employer_pipes: list[dict] | None = None,
+        centrality: list[dict] | None = None,
+        clusters: list[dict] | None = None,
+        flows: list[dict] | None = None,
+    ) -> list[dict]:
+        """
+        Run all analyses and produce a list of ranked insights.
+
+        Each insight is a plain dict with the fields of ``NetworkInsight``
+        (``NetworkInsight(**d)`` gives the typed view).  Callers that
+        already hold analysis results (at least as many rows as used
+        here) can pass them in to skip recomputation.
+        """
+        if edu_hubs is None:
+            edu_hubs = self.education_hubs(10)
+        if employer_pipes is None:
+            employer_pipes = self.employer_pipelines(10)
+        if centrality is None:
+            centrality = self.centrality_rankings(5)
+        if clusters is None:
+            clusters = self.detect_clusters(3)
+        if flows is None:
+            flows = self.founder_to_company_flow(10)
+
+        insights: list[dict] = []
 
         # Education hubs
-        for hub in self.education_hubs(10):
+        for hub in edu_hubs[:10]:
             if hub["founder_count"] >= 3:
                 insights.append(
-                    NetworkInsight(
+                    dict(
                         category="education_hub",
                         title=f"{hub['institution']} Founder Factory",
                         detail=f"{hub['institution']} produced {hub['founder_count']} founders in this sector.",
@@ -292,10 +629,10 @@ class NetworkAnalyser:
                 )
 
         # Employer pipelines
-        for pipe in self.employer_pipelines(10):
+        for pipe in employer_pipes[:10]:
             if pipe["founder_count"] >= 3:
                 insights.append(
-                    NetworkInsight(
+                    dict(
                         category="employer_pipeline",
                         title=f"{pipe['employer']} Alumni Mafia",
                         detail=f"{pipe['employer']} spawned {pipe['founder_count']} founders.",
@@ -305,10 +642,10 @@ class NetworkAnalyser:
                 )
 
         # Bridge founders (high centrality)
-        for bridge in self.centrality_rankings(5):
+        for bridge in centrality[:5]:
             if bridge["centrality"] > 0.01:
                 insights.append(
-                    NetworkInsight(
+                    dict(
                         category="bridge_founder",
                         title=f"{bridge['name']} — Network Connector",
                         detail=(
@@ -322,10 +659,10 @@ class NetworkAnalyser:
                 )
 
         # Clusters / mafias
-        for cluster in self.detect_clusters(3):
+        for cluster in clusters:
             top_ctx = cluster["dominant_context"][0]["entity"] if cluster["dominant_context"] else "unknown"
             insights.append(
-                NetworkInsight(
+                dict(
                     category="cluster",
                     title=f"{top_ctx} Cluster ({cluster['size']} founders)",
                     detail=f"Tight cluster of {cluster['size']} founders dominated by {top_ctx} connections.",
@@ -335,9 +672,9 @@ class NetworkAnalyser:
             )
 
         # Employer → Company flows
-        for flow in self.founder_to_company_flow()[:10]:
+        for flow in flows[:10]:
             insights.append(
-                NetworkInsight(
+                dict(
                     category="talent_flow",
                     title=f"{flow['from_employer']} → {flow['to_company']}",
                     detail=(
@@ -349,4 +686,4 @@ class NetworkAnalyser:
                 )
             )
 
-        return sorted(insights, key=lambda i: i.score, reverse=True)
+        return sorted(insights, key=lambda i: i["score"], reverse=True)
@@ -11,9 +11,15 @@ single HTML file with a client-side sector selector.
 
 from __future__ import annotations
 
-import json
+import itertools
+import os
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
+from typing import Any
 
+import orjson
 from jinja2 import Environment, FileSystemLoader
 
 from pipeline.analysis.network import NetworkAnalyser, NetworkInsight
@@ -22,6 +28,14 @@ from pipeline.models.schema import Company, Founder
 TEMPLATE_DIR = Path(__file__).resolve().parents[2] / "templates"
 OUTPUT_DIR = Path(__file__).resolve().parents[2] / "output"
 
+# Shared template environment — templates are parsed once per process.
+# Autoescape stays off: the template embeds raw JSON in a <script> block.
+_ENV = Environment(
+    loader=FileSystemLoader(str(TEMPLATE_DIR)),
+    autoescape=False,
+    auto_reload=False,
+)
+
 # ------------------------------------------------------------------
 # Sector registry — canonical list of sectors shown in the UI.
 # id must match the key used in SECTOR_DATA on the JS side.
@@ -38,6 +52,15 @@ SECTOR_REGISTRY = [
 ]
 
 
+# Report encoding; numpy scalars can surface from the accelerated backends
+_REPORT_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _j(obj: Any) -> str:
+    """Serialise a template payload to a JSON string (orjson, C-backed)."""
+    return orjson.dumps(obj, default=str).decode()
+
+
 def _ensure_dirs() -> None:
     TEMPLATE_DIR.mkdir(parents=True, exist_ok=True)
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -59,26 +82,58 @@ def _sector_id_from_name(sector_name: str) -> str:
     return lower.replace(" ", "_")
 
 
+def run_analyses(analyser: NetworkAnalyser) -> dict:
+    """
+    Run every analysis once and return the results.
+
+    The dict can be handed to both ``generate_dashboard`` and
+    ``export_json_report`` so neither repeats the work.
+    """
+    edu_hubs = analyser.education_hubs(15)
+    employer_pipes = analyser.employer_pipelines(15)
+    centrality = analyser.centrality_rankings(20)
+    clusters = analyser.detect_clusters(3)
+    flows = analyser.founder_to_company_flow(15)
+    insights = analyser.generate_insights(
+        edu_hubs=edu_hubs,
+        employer_pipes=employer_pipes,
+        centrality=centrality,
+        clusters=clusters,
+        flows=flows,
+    )
+    return {
+        "edu_hubs": edu_hubs,
+        "employer_pipes": employer_pipes,
+        "centrality": centrality,
+        "clusters": clusters,
+        "flows": flows,
+        "geo": analyser.geographic_distribution(),
+        "insights": insights,
+    }
+
+
+def _export_insights(insights: list[dict]) -> list[dict]:
+    """Insight fields that are exported; ``entities`` stays in-process."""
+    return [
+        {"category": i["category"], "title": i["title"], "detail": i["detail"], "score": i["score"]}
+        for i in insights
+    ]
+
+
 def _build_sector_data(
     sector_name: str,
     companies: list[Company],
     founders: list[Founder],
     analyser: NetworkAnalyser,
+    analyses: dict | None = None,
 ) -> dict:
     """Run all analyses and return a dict suitable for embedding as JSON."""
-    edu_hubs = analyser.education_hubs(15)
-    employer_pipes = analyser.employer_pipelines(15)
-    centrality = analyser.centrality_rankings(20)
-    clusters = analyser.detect_clusters(3)
-    flows = analyser.founder_to_company_flow()[:15]
-    geo = analyser.geographic_distribution()
-    insights_raw = analyser.generate_insights()
-    insights = [
-        {"category": i.category, "title": i.title, "detail": i.detail, "score": i.score}
-        for i in insights_raw[:20]
-    ]
+    if analyses is None:
+        analyses = run_analyses(analyser)
+    clusters = analyses["clusters"]
 
     # Founder matrix
+    companies_by_id = {c.id: c for c in companies}
     matrix_data = []
     for f in founders:
         edu_str = ", ".join(
@@ -88,7 +143,7 @@ def _build_sector_data(
         work_str = ", ".join(w.company for w in f.work_history) or "\u2014"
         company_names = []
         for cid in f.companies:
-            match = next((c for c in companies if c.id == cid), None)
+            match = companies_by_id.get(cid)
             company_names.append(match.name if match else cid)
 
         matrix_data.append({
@@ -108,14 +163,14 @@ def _build_sector_data(
         "total_founders": len(founders),
         "total_edges": total_edges,
         "num_clusters": len(clusters),
-        "edu_hubs": edu_hubs,
-        "employer_pipes": employer_pipes,
-        "centrality": centrality,
+        "edu_hubs": analyses["edu_hubs"],
+        "employer_pipes": analyses["employer_pipes"],
+        "centrality": analyses["centrality"],
         "clusters": clusters,
-        "flows": flows,
-        "geo": geo,
+        "flows": analyses["flows"],
+        "geo": analyses["geo"],
         "matrix": matrix_data,
-        "insights": insights,
+        "insights": _export_insights(analyses["insights"][:20]),
     }
 
 
@@ -127,6 +182,7 @@ def generate_dashboard(
     output_filename: str | None = None,
     *,
     extra_sectors: dict[str, dict] | None = None,
+    analyses: dict | None = None,
 ) -> Path:
     """
     Generate an HTML dashboard from analysis results.
@@ -139,6 +195,7 @@ def generate_dashboard(
         output_filename: Optional output file name.
         extra_sectors: Optional mapping of sector_id -> sector_data dict
             (as returned by _build_sector_data) for additional sectors to embed.
+        analyses: Optional precomputed results from run_analyses(analyser).
 
     Returns the path to the generated file.
     """
@@ -146,7 +203,7 @@ def generate_dashboard(
 
     # Build primary sector data
     primary_id = _sector_id_from_name(sector_name)
-    primary_data = _build_sector_data(sector_name, companies, founders, analyser)
+    primary_data = _build_sector_data(sector_name, companies, founders, analyser, analyses)
 
     # Assemble all sector data
     all_sector_data: dict[str, dict] = {primary_id: primary_data}
@@ -165,8 +222,8 @@ def generate_dashboard(
     context = {
         "page_title": "Founder Networks",
         "active_sector": primary_id,
-        "sectors_json": json.dumps(sectors_for_template, default=str),
-        "all_sector_data_json": json.dumps(all_sector_data, default=str),
+        "sectors_json": _j(sectors_for_template),
+        "all_sector_data_json": _j(all_sector_data),
         # Backward-compat flat vars for the primary sector
         "sector_name": sector_name,
         "total_companies": primary_data["total_companies"],
@@ -175,36 +232,102 @@ def generate_dashboard(
         "clusters": primary_data["clusters"],
     }
 
-    env = Environment(loader=FileSystemLoader(str(TEMPLATE_DIR)), autoescape=False)
-    template = env.get_template("dashboard.html")
-    html = template.render(**context)
+    template = _ENV.get_template("dashboard.html")
 
     fname = output_filename or f"{sector_name.lower().replace(' ', '_')}_dashboard.html"
     out_path = OUTPUT_DIR / fname
-    out_path.write_text(html)
+    template.stream(**context).dump(str(out_path), encoding="utf-8")
     return out_path
 
 
+def _analyse_sector(
+    sector_name: str,
+    companies: list[Company],
+    founders: list[Founder],
+    exact_centrality: bool = False,
+    backend: str = "auto",
+    processes: int | None = None,
+) -> dict:
+    """
+    Build a sector's graph and dashboard payload.
+
+    generate_multi_sector_dashboard's pool workers pass ``processes=1`` so
+    per-sector betweenness does not open a nested pool on top of the
+    sector fan-out.
+    """
+    analyser = NetworkAnalyser(
+        companies,
+        founders,
+        processes=processes,
+        exact_centrality=exact_centrality,
+        backend=backend,
+    )
+    analyser.build_graph()
+    return _build_sector_data(sector_name, companies, founders, analyser)
+
+
 def generate_multi_sector_dashboard(
-    sector_datasets: list[tuple[str, list[Company], list[Founder], NetworkAnalyser]],
+    sector_datasets: Iterable[tuple[str, list[Company], list[Founder], NetworkAnalyser | None]],
     output_filename: str = "multi_sector_dashboard.html",
+    exact_centrality: bool = False,
+    backend: str = "auto",
 ) -> Path:
     """
     Generate a single dashboard with data for multiple sectors.
 
+    With more than one sector, each sector is analysed in its own worker
+    process; analysers passed in are then ignored (graphs are rebuilt in
+    the workers), so callers may pass None instead of building them.
+    *sector_datasets* may be a generator: sectors are handed to the pool
+    as they arrive, with at most one per worker in flight, so the parent
+    never holds every sector's models at once.
+
     Args:
-        sector_datasets: List of (sector_name, companies, founders, analyser) tuples.
+        sector_datasets: Iterable of (sector_name, companies, founders, analyser) tuples.
         output_filename: Output file name.
+        exact_centrality: Score betweenness exactly in analysers built here.
+        backend: Betweenness backend for analysers built here.
     """
-    if not sector_datasets:
+    datasets = iter(sector_datasets)
+    first = next(datasets, None)
+    if first is None:
         raise ValueError("At least one sector dataset is required")
+    second = next(datasets, None)
+
+    # Build data for every sector, as (sector_name, payload)
+    results: list[tuple[str, dict]] = []
+    if second is None:
+        sector_name, companies, founders, analyser = first
+        if analyser is None:
+            data = _analyse_sector(
+                sector_name, companies, founders, exact_centrality, backend
+            )
+        else:
+            data = _build_sector_data(sector_name, companies, founders, analyser)
+        results.append((sector_name, data))
+    else:
+        workers = os.cpu_count() or 1
+        remaining = itertools.chain((first, second), datasets)
+        first = second = None
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending: deque[tuple[str, Future]] = deque()
+            for sector_name, companies, founders, _ in remaining:
+                pending.append((sector_name, pool.submit(
+                    _analyse_sector, sector_name, companies, founders,
+                    exact_centrality, backend, 1,
+                )))
+                if len(pending) >= workers:
+                    name, future = pending.popleft()
+                    results.append((name, future.result()))
+            while pending:
+                name, future = pending.popleft()
+                results.append((name, future.result()))
 
-    # Build data for every sector
     all_sector_data: dict[str, dict] = {}
     first_id = None
-    for sector_name, companies, founders, analyser in sector_datasets:
+    for sector_name, data in results:
         sid = _sector_id_from_name(sector_name)
-        all_sector_data[sid] = _build_sector_data(sector_name, companies, founders, analyser)
+        all_sector_data[sid] = data
         if first_id is None:
             first_id = sid
 
@@ -224,8 +347,8 @@ def generate_multi_sector_dashboard(
     context = {
         "page_title": "Founder Networks",
         "active_sector": first_id,
-        "sectors_json": json.dumps(sectors_for_template, default=str),
-        "all_sector_data_json": json.dumps(all_sector_data, default=str),
+        "sectors_json": _j(sectors_for_template),
+        "all_sector_data_json": _j(all_sector_data),
         "sector_name": primary["sector_name"],
         "total_companies": primary["total_companies"],
         "total_founders": primary["total_founders"],
@@ -233,12 +356,10 @@ def generate_multi_sector_dashboard(
         "clusters": primary["clusters"],
     }
 
-    env = Environment(loader=FileSystemLoader(str(TEMPLATE_DIR)), autoescape=False)
-    template = env.get_template("dashboard.html")
-    html = template.render(**context)
+    template = _ENV.get_template("dashboard.html")
 
     out_path = OUTPUT_DIR / output_filename
-    out_path.write_text(html)
+    template.stream(**context).dump(str(out_path), encoding="utf-8")
     return out_path
 
 
@@ -246,25 +367,31 @@ def export_json_report(
     sector_name: str,
     analyser: NetworkAnalyser,
     output_filename: str | None = None,
+    *,
+    analyses: dict | None = None,
 ) -> Path:
-    """Export the full analysis as a JSON report."""
+    """
+    Export the full analysis as a JSON report.
+
+    Pass ``analyses`` (from run_analyses) to reuse results already
+    computed for the dashboard.
+    """
     _ensure_dirs()
+    if analyses is None:
+        analyses = run_analyses(analyser)
 
     report = {
         "sector": sector_name,
-        "education_hubs": analyser.education_hubs(15),
-        "employer_pipelines": analyser.employer_pipelines(15),
-        "centrality_rankings": analyser.centrality_rankings(20),
-        "clusters": analyser.detect_clusters(3),
-        "talent_flows": analyser.founder_to_company_flow()[:15],
-        "geographic_distribution": analyser.geographic_distribution(),
-        "insights": [
-            {"category": i.category, "title": i.title, "detail": i.detail, "score": i.score}
-            for i in analyser.generate_insights()
-        ],
+        "education_hubs": analyses["edu_hubs"],
+        "employer_pipelines": analyses["employer_pipes"],
+        "centrality_rankings": analyses["centrality"],
+        "clusters": analyses["clusters"],
+        "talent_flows": analyses["flows"],
+        "geographic_distribution": analyses["geo"],
+        "insights": _export_insights(analyses["insights"]),
     }
 
     fname = output_filename or f"{sector_name.lower().replace(' ', '_')}_report.json"
     out_path = OUTPUT_DIR / fname
-    out_path.write_text(json.dumps(report, indent=2, default=str))
+    out_path.write_bytes(orjson.dumps(report, default=str, option=_REPORT_OPTS))
     return out_path
@@ -0,0 +1,87 @@
+"""
+msgspec mirrors of the snapshot models, for ``run.py --fast-models``.
+
+``msgspec.json.decode`` parses snapshot bytes straight into these Structs
+— no intermediate dicts, and type checks happen inside the decoder.  They
+expose the same attributes as the dataclasses in ``schema``, which is all
+NetworkAnalyser and the dashboard read.  Snapshot fields the analysis does
+not use (edges, metadata, generated_at) are skipped while decoding.
+
+Importing this module requires msgspec.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import msgspec
+
+from pipeline.models.schema import DataSource
+
+
+class EducationMS(msgspec.Struct, kw_only=True):
+    institution: str
+    degree: Optional[str] = None
+    field: Optional[str] = None
+    year: Optional[int] = None
+
+
+class WorkExperienceMS(msgspec.Struct, kw_only=True):
+    company: str
+    role: Optional[str] = None
+    start_year: Optional[int] = None
+    end_year: Optional[int] = None
+
+
+class FounderMS(msgspec.Struct, kw_only=True):
+    id: str
+    name: str
+    companies: list[str] = []
+    education: list[EducationMS] = []
+    work_history: list[WorkExperienceMS] = []
+    linkedin_url: Optional[str] = None
+    source: DataSource = DataSource.MANUAL
+    verified: bool = False
+    tags: list[str] = []
+
+
+class FundingRoundMS(msgspec.Struct, kw_only=True):
+    round_type: str
+    amount_usd: Optional[int] = None
+    date: Optional[str] = None
+    investors: list[str] = []
+
+
+class CompanyMS(msgspec.Struct, kw_only=True):
+    id: str
+    name: str
+    domain: Optional[str] = None
+    sector: str = ""
+    sub_sector: Optional[str] = None
+    city: Optional[str] = None
+    country: str = "India"
+    founded_year: Optional[int] = None
+    total_funding_usd: Optional[int] = None
+    valuation_usd: Optional[int] = None
+    employee_count: Optional[int] = None
+    founders: list[str] = []
+    funding_rounds: list[FundingRoundMS] = []
+    source: DataSource = DataSource.MANUAL
+    tracxn_id: Optional[str] = None
+
+
+class SnapshotMS(msgspec.Struct, kw_only=True):
+    """The parts of a NetworkSnapshot the analysis commands read."""
+    sector: str = ""
+    companies: list[CompanyMS] = []
+    founders: list[FounderMS] = []
+
+
+_decoder = msgspec.json.Decoder(SnapshotMS)
+
+
+def decode_snapshot(data: bytes | dict) -> SnapshotMS:
+    """Decode raw snapshot JSON bytes, or convert an already decoded dict."""
+    if isinstance(data, dict):
+        return msgspec.convert(data, SnapshotMS)
+    return _decoder.decode(data)
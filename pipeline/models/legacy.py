@@ -9,6 +9,9 @@ manually curated, then layer Tracxn data on top.
 from __future__ import annotations
 
 import re
+from collections import namedtuple
+from functools import lru_cache
+
 from pipeline.models.schema import (
     Company,
     DataSource,
@@ -17,140 +20,312 @@ from pipeline.models.schema import (
     WorkExperience,
 )
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+# ASCII punctuation/whitespace -> "-" for the regex-free _slug fast path
+_SLUG_TABLE = str.maketrans({
+    c: "-" for c in map(chr, range(128))
+    if not ("a" <= c <= "z" or "0" <= c <= "9")
+})
+# Degree tokens, matched as whole words. A word bounded by \b on both
+# sides is exactly a maximal \w+ run, so one linear token scan plus a set
+# lookup finds the first degree without regex alternation/backtracking.
+_DEGREES = frozenset({"BTech", "MTech", "BE", "MBA", "MS", "BSc", "BA"})
+_WORD_RE = re.compile(r"\w+")
+
+# Known institutions: canonical name -> other spellings. Matched
+# case-insensitively on word boundaries via _INSTITUTION_TRIE.
+_INSTITUTIONS: dict[str, tuple[str, ...]] = {
+    "IIT Delhi": ("IIT-Delhi", "IITD"),
+    "IIT Bombay": ("IIT-Bombay", "IITB"),
+    "IIT Kanpur": ("IIT-Kanpur",),
+    "IIT Kharagpur": ("IIT-Kharagpur", "IIT KGP"),
+    "IIT Madras": ("IIT-Madras",),
+    "IIT Roorkee": ("IIT-Roorkee",),
+    "IIM-A": ("IIM Ahmedabad", "IIMA"),
+    "IIM Bangalore": ("IIM-B", "IIMB"),
+    "IIM Calcutta": ("IIM-C", "IIMC"),
+    "ISB": ("Indian School of Business",),
+    "BITS Pilani": ("BITS-Pilani",),
+    "DCE/DTU": ("DCE", "DTU", "Delhi College of Engineering"),
+    "INSEAD": (),
+    "Wharton": (),
+    "UCLA": (),
+    "UCLA/LBS": (),
+    "Purdue": (),
+    "Stanford": (),
+    "Harvard": (),
+}
+
+# Shared by every legacy row
+_CEO_SUFFIX = " (CEO)"
+_FINTECH_SECTOR = "FinTech"
+_INDIA = "India"
+_MANUAL = DataSource.MANUAL
+
 
 # ------------------------------------------------------------------
 # The original verified dataset (from index.html matrixData)
 # ------------------------------------------------------------------
 
-_RAW_MATRIX = [
-    {"name": "Vijay Shekhar Sharma", "company": "Paytm", "edu": "DCE/DTU BE 1998", "work": "India Today, RiverRun Software", "tags": ["tag-dce"]},
-    {"name": "Harinder Takhar", "company": "Paytm", "edu": "DCE/DTU BE 1998, INSEAD MBA 2006", "work": "One97 Communications", "tags": ["tag-dce"]},
-    {"name": "Yashish Dahiya", "company": "Policybazaar", "edu": "IIT Delhi BTech 1994, IIM-A 1996, INSEAD MBA 2001", "work": "—", "tags": ["tag-iitd", "tag-iim"]},
-    {"name": "Sarbvir Singh", "company": "Policybazaar", "edu": "IIT Delhi 1993, IIM-A MBA 1995", "work": "Citi, Emerson", "tags": ["tag-iitd", "tag-iim"]},
-    {"name": "Ashneer Grover", "company": "BharatPe", "edu": "IIT Delhi BTech 2004, IIM-A MBA 2006", "work": "AmEx, Kotak, Grofers", "tags": ["tag-iitd", "tag-iim"]},
-    {"name": "Shashvat Nakrani", "company": "BharatPe", "edu": "IIT Delhi 2019", "work": "—", "tags": ["tag-iitd"]},
-    {"name": "Sameer Nigam", "company": "PhonePe", "edu": "Univ of Mumbai, Univ of Arizona MS, Wharton MBA", "work": "Flipkart SVP, Shopzilla", "tags": ["tag-fk"]},
-    {"name": "Rahul Chari", "company": "PhonePe", "edu": "—", "work": "Flipkart", "tags": ["tag-fk"]},
-    {"name": "Burzin Engineer", "company": "PhonePe", "edu": "—", "work": "Flipkart", "tags": ["tag-fk"]},
-    {"name": "Ajay Bhat", "company": "PhonePe", "edu": "—", "work": "Flipkart", "tags": ["tag-fk"]},
-    {"name": "Lalit Keshre", "company": "Groww", "edu": "IIT Bombay BTech+MTech EE 2004", "work": "Flipkart PM, Ittiam, Eduflix", "tags": ["tag-iitb", "tag-fk"]},
-    {"name": "Harsh Jain", "company": "Groww", "edu": "IIT Delhi BTech+MTech, UCLA MBA", "work": "Flipkart PM", "tags": ["tag-iitd", "tag-fk"]},
-    {"name": "Ishan Bansal", "company": "Groww", "edu": "BITS Pilani", "work": "Flipkart, ICICI Bank", "tags": ["tag-bits", "tag-fk", "tag-icici"]},
-    {"name": "Neeraj Singh", "company": "Groww", "edu": "—", "work": "Flipkart", "tags": ["tag-fk"]},
-    {"name": "Harshil Mathur", "company": "Razorpay", "edu": "IIT Roorkee", "work": "—", "tags": []},
-    {"name": "Shashank Kumar", "company": "Razorpay", "edu": "IIT Roorkee", "work": "—", "tags": []},
-    {"name": "Sachin Bansal", "company": "Navi", "edu": "IIT Delhi BTech CS 2005", "work": "Amazon, Flipkart (co-founder)", "tags": ["tag-iitd"]},
-    {"name": "Ankit Agarwal", "company": "Navi", "edu": "IIT Delhi BTech 2004, IIM-A MBA 2008", "work": "Bank of America, Deutsche Bank", "tags": ["tag-iitd", "tag-iim"]},
-    {"name": "Bipin Preet Singh", "company": "MobiKwik", "edu": "IIT Delhi BTech 2002", "work": "Freescale, NVIDIA, Intel", "tags": ["tag-iitd"]},
-    {"name": "Chandan Joshi", "company": "MobiKwik", "edu": "IIT Delhi BTech 2004, UCLA/LBS MBA", "work": "Credit Suisse", "tags": ["tag-iitd"]},
-    {"name": "Anurag Sinha", "company": "OneCard", "edu": "IIM Bangalore", "work": "ICICI Bank", "tags": ["tag-iim", "tag-icici"]},
-    {"name": "Rupesh Kumar", "company": "OneCard", "edu": "IIT Delhi BTech 1999, ISB MBA 2004", "work": "ICICI Bank", "tags": ["tag-iitd", "tag-icici"]},
-    {"name": "Devang Shah", "company": "OneCard", "edu": "—", "work": "ICICI Bank", "tags": ["tag-icici"]},
-    {"name": "Vibhav Hathi", "company": "OneCard", "edu": "—", "work": "ICICI Bank", "tags": ["tag-icici"]},
-    {"name": "Hari Velayudan", "company": "OneCard", "edu": "—", "work": "Citrus Payment", "tags": []},
-    {"name": "Jitendra Gupta", "company": "Jupiter", "edu": "—", "work": "ICICI Bank, Citrus (co-founder), PayU", "tags": ["tag-icici"]},
-    {"name": "Amrish Rau", "company": "Pine Labs (CEO)", "edu": "—", "work": "Citrus (co-founder)", "tags": []},
-    {"name": "Lokvir Kapoor", "company": "Pine Labs", "edu": "IIT Kanpur, IIM Bangalore", "work": "—", "tags": ["tag-iim"]},
-    {"name": "Puneet Agarwal", "company": "Money View", "edu": "IIT Delhi BTech, Purdue MBA", "work": "Google, McKinsey, Capital One", "tags": ["tag-iitd"]},
-    {"name": "Sanjay Aggarwal", "company": "Money View", "edu": "IIT Delhi BTech 1993", "work": "Yahoo, Minglebox", "tags": ["tag-iitd"]},
-    {"name": "Kavitha Subramanian", "company": "Upstox", "edu": "IIT Bombay, Wharton MBA", "work": "McKinsey", "tags": ["tag-iitb"]},
-    {"name": "Sumit Gupta", "company": "CoinDCX", "edu": "IIT Bombay", "work": "—", "tags": ["tag-iitb"]},
-    {"name": "Neeraj Khandelwal", "company": "CoinDCX", "edu": "IIT Bombay", "work": "—", "tags": ["tag-iitb"]},
-    {"name": "Ravish Naresh", "company": "Khatabook", "edu": "IIT Bombay", "work": "Housing.com", "tags": ["tag-iitb"]},
-    {"name": "Ashish Sonone", "company": "Khatabook", "edu": "IIT Bombay", "work": "—", "tags": ["tag-iitb"]},
-    {"name": "Dhanesh Kumar", "company": "Khatabook", "edu": "IIT Bombay", "work": "—", "tags": ["tag-iitb"]},
-    {"name": "Jaideep Poonia", "company": "Khatabook", "edu": "IIT Bombay", "work": "—", "tags": ["tag-iitb"]},
-    {"name": "Sujith Narayanan", "company": "Fi", "edu": "—", "work": "Google", "tags": []},
-    {"name": "Sumit Gwalani", "company": "Fi", "edu": "—", "work": "Google", "tags": []},
-    {"name": "Ashish Kashyap", "company": "INDMoney", "edu": "—", "work": "Google, ibibo", "tags": []},
-    {"name": "Asish Mohapatra", "company": "Oxyzo", "edu": "IIT Kharagpur, ISB", "work": "McKinsey", "tags": []},
-    {"name": "Ruchi Kalra", "company": "Oxyzo", "edu": "IIT Delhi BTech 2004, ISB MBA 2007", "work": "McKinsey, Evalueserve", "tags": ["tag-iitd"]},
-    {"name": "Rajan Bajaj", "company": "slice", "edu": "IIT Kharagpur", "work": "Flipkart", "tags": ["tag-fk"]},
-    {"name": "Deepak Malhotra", "company": "slice", "edu": "BITS Pilani", "work": "—", "tags": ["tag-bits"]},
-    {"name": "Anand Prabhudesai", "company": "Turtlemint", "edu": "IIT Bombay", "work": "—", "tags": ["tag-iitb"]},
-    {"name": "Dhirendra Mahyavanshi", "company": "Turtlemint", "edu": "—", "work": "ICICI Bank, Quikr", "tags": ["tag-icici"]},
-    {"name": "Sumit Maniyar", "company": "Rupeek", "edu": "IIT Bombay", "work": "—", "tags": ["tag-iitb"]},
-    {"name": "Ashwin Soni", "company": "Rupeek", "edu": "IIT Bombay", "work": "—", "tags": ["tag-iitb"]},
-    {"name": "Nitin Gupta", "company": "PayU", "edu": "IIT Delhi BTech+MTech 2008", "work": "Royal Bank of Scotland", "tags": ["tag-iitd"]},
-    {"name": "Sanjeev Srinivasan", "company": "ACKO", "edu": "—", "work": "ICICI Bank", "tags": ["tag-icici"]},
-    {"name": "Deena Jacob", "company": "Open", "edu": "—", "work": "ICICI Bank", "tags": ["tag-icici"]},
-    {"name": "Anish Achuthan", "company": "Open", "edu": "—", "work": "Citrus Payment", "tags": []},
-    {"name": "Mabel Chacko", "company": "Open", "edu": "IIM Bangalore", "work": "—", "tags": ["tag-iim"]},
-]
+_Row = namedtuple("_Row", "name company edu work tags")
+
+_RAW_MATRIX = (
+    _Row("Vijay Shekhar Sharma", "Paytm", "DCE/DTU BE 1998", "India Today, RiverRun Software", ("tag-dce",)),
+    _Row("Harinder Takhar", "Paytm", "DCE/DTU BE 1998, INSEAD MBA 2006", "One97 Communications", ("tag-dce",)),
+    _Row("Yashish Dahiya", "Policybazaar", "IIT Delhi BTech 1994, IIM-A 1996, INSEAD MBA 2001", "—", ("tag-iitd", "tag-iim")),
+    _Row("Sarbvir Singh", "Policybazaar", "IIT Delhi 1993, IIM-A MBA 1995", "Citi, Emerson", ("tag-iitd", "tag-iim")),
+    _Row("Ashneer Grover", "BharatPe", "IIT Delhi BTech 2004, IIM-A MBA 2006", "AmEx, Kotak, Grofers", ("tag-iitd", "tag-iim")),
+    _Row("Shashvat Nakrani", "BharatPe", "IIT Delhi 2019", "—", ("tag-iitd",)),
+    _Row("Sameer Nigam", "PhonePe", "Univ of Mumbai, Univ of Arizona MS, Wharton MBA", "Flipkart SVP, Shopzilla", ("tag-fk",)),
+    _Row("Rahul Chari", "PhonePe", "—", "Flipkart", ("tag-fk",)),
+    _Row("Burzin Engineer", "PhonePe", "—", "Flipkart", ("tag-fk",)),
+    _Row("Ajay Bhat", "PhonePe", "—", "Flipkart", ("tag-fk",)),
+    _Row("Lalit Keshre", "Groww", "IIT Bombay BTech+MTech EE 2004", "Flipkart PM, Ittiam, Eduflix", ("tag-iitb", "tag-fk")),
+    _Row("Harsh Jain", "Groww", "IIT Delhi BTech+MTech, UCLA MBA", "Flipkart PM", ("tag-iitd", "tag-fk")),
+    _Row("Ishan Bansal", "Groww", "BITS Pilani", "Flipkart, ICICI Bank", ("tag-bits", "tag-fk", "tag-icici")),
+    _Row("Neeraj Singh", "Groww", "—", "Flipkart", ("tag-fk",)),
+    _Row("Harshil Mathur", "Razorpay", "IIT Roorkee", "—", ()),
+    _Row("Shashank Kumar", "Razorpay", "IIT Roorkee", "—", ()),
+    _Row("Sachin Bansal", "Navi", "IIT Delhi BTech CS 2005", "Amazon, Flipkart (co-founder)", ("tag-iitd",)),
+    _Row("Ankit Agarwal", "Navi", "IIT Delhi BTech 2004, IIM-A MBA 2008", "Bank of America, Deutsche Bank", ("tag-iitd", "tag-iim")),
+    _Row("Bipin Preet Singh", "MobiKwik", "IIT Delhi BTech 2002", "Freescale, NVIDIA, Intel", ("tag-iitd",)),
+    _Row("Chandan Joshi", "MobiKwik", "IIT Delhi BTech 2004, UCLA/LBS MBA", "Credit Suisse", ("tag-iitd",)),
+    _Row("Anurag Sinha", "OneCard", "IIM Bangalore", "ICICI Bank", ("tag-iim", "tag-icici")),
+    _Row("Rupesh Kumar", "OneCard", "IIT Delhi BTech 1999, ISB MBA 2004", "ICICI Bank", ("tag-iitd", "tag-icici")),
+    _Row("Devang Shah", "OneCard", "—", "ICICI Bank", ("tag-icici",)),
+    _Row("Vibhav Hathi", "OneCard", "—", "ICICI Bank", ("tag-icici",)),
+    _Row("Hari Velayudan", "OneCard", "—", "Citrus Payment", ()),
+    _Row("Jitendra Gupta", "Jupiter", "—", "ICICI Bank, Citrus (co-founder), PayU", ("tag-icici",)),
+    _Row("Amrish Rau", "Pine Labs (CEO)", "—", "Citrus (co-founder)", ()),
+    _Row("Lokvir Kapoor", "Pine Labs", "IIT Kanpur, IIM Bangalore", "—", ("tag-iim",)),
+    _Row("Puneet Agarwal", "Money View", "IIT Delhi BTech, Purdue MBA", "Google, McKinsey, Capital One", ("tag-iitd",)),
+    _Row("Sanjay Aggarwal", "Money View", "IIT Delhi BTech 1993", "Yahoo, Minglebox", ("tag-iitd",)),
+    _Row("Kavitha Subramanian", "Upstox", "IIT Bombay, Wharton MBA", "McKinsey", ("tag-iitb",)),
+    _Row("Sumit Gupta", "CoinDCX", "IIT Bombay", "—", ("tag-iitb",)),
+    _Row("Neeraj Khandelwal", "CoinDCX", "IIT Bombay", "—", ("tag-iitb",)),
+    _Row("Ravish Naresh", "Khatabook", "IIT Bombay", "Housing.com", ("tag-iitb",)),
+    _Row("Ashish Sonone", "Khatabook", "IIT Bombay", "—", ("tag-iitb",)),
+    _Row("Dhanesh Kumar", "Khatabook", "IIT Bombay", "—", ("tag-iitb",)),
+    _Row("Jaideep Poonia", "Khatabook", "IIT Bombay", "—", ("tag-iitb",)),
+    _Row("Sujith Narayanan", "Fi", "—", "Google", ()),
+    _Row("Sumit Gwalani", "Fi", "—", "Google", ()),
+    _Row("Ashish Kashyap", "INDMoney", "—", "Google, ibibo", ()),
+    _Row("Asish Mohapatra", "Oxyzo", "IIT Kharagpur, ISB", "McKinsey", ()),
+    _Row("Ruchi Kalra", "Oxyzo", "IIT Delhi BTech 2004, ISB MBA 2007", "McKinsey, Evalueserve", ("tag-iitd",)),
+    _Row("Rajan Bajaj", "slice", "IIT Kharagpur", "Flipkart", ("tag-fk",)),
+    _Row("Deepak Malhotra", "slice", "BITS Pilani", "—", ("tag-bits",)),
+    _Row("Anand Prabhudesai", "Turtlemint", "IIT Bombay", "—", ("tag-iitb",)),
+    _Row("Dhirendra Mahyavanshi", "Turtlemint", "—", "ICICI Bank, Quikr", ("tag-icici",)),
+    _Row("Sumit Maniyar", "Rupeek", "IIT Bombay", "—", ("tag-iitb",)),
+    _Row("Ashwin Soni", "Rupeek", "IIT Bombay", "—", ("tag-iitb",)),
+    _Row("Nitin Gupta", "PayU", "IIT Delhi BTech+MTech 2008", "Royal Bank of Scotland", ("tag-iitd",)),
+    _Row("Sanjeev Srinivasan", "ACKO", "—", "ICICI Bank", ("tag-icici",)),
+    _Row("Deena Jacob", "Open", "—", "ICICI Bank", ("tag-icici",)),
+    _Row("Anish Achuthan", "Open", "—", "Citrus Payment", ()),
+    _Row("Mabel Chacko", "Open", "IIM Bangalore", "—", ("tag-iim",)),
+)
 
 
 def _slug(text: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+    text = text.lower()
+    if text.isascii():
+        text = text.translate(_SLUG_TABLE)
+    else:
+        text = _SLUG_RE.sub("-", text)
+    # Collapse runs of "-" and trim the ends
+    return "-".join(filter(None, text.split("-")))
+
+
+def _is_word(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
+
+def _find_year(s: str) -> int | None:
+    """
+    First standalone 19xx/20xx year in *s* — a hand-rolled equivalent of
+    ``re.search(r"\b(?:19|20)\d{2}\b", s)``.
+    """
+    for i in range(len(s) - 3):
+        c, d = s[i], s[i + 1]
+        if (c == "1" and d == "9") or (c == "2" and d == "0"):
+            if (
+                s[i + 2].isdecimal()
+                and s[i + 3].isdecimal()
+                and (i == 0 or not _is_word(s[i - 1]))
+                and (i + 4 == len(s) or not _is_word(s[i + 4]))
+            ):
+                return int(s[i:i + 4])
+    return None
+
+
+def _build_trie(names: dict[str, tuple[str, ...]]) -> dict:
+    """Character trie over lower-cased spellings; "" marks a canonical name."""
+    root: dict = {}
+    for canonical, aliases in names.items():
+        for spelling in (canonical, *aliases):
+            node = root
+            for ch in spelling.lower():
+                node = node.setdefault(ch, {})
+            node[""] = canonical
+    return root
+
+
+_INSTITUTION_TRIE = _build_trie(_INSTITUTIONS)
+
+
+def _match_institution(part: str) -> tuple[str, int, int] | None:
+    """
+    Leftmost-longest known institution in *part* that sits on word
+    boundaries: (canonical name, start, end), or None.
+    """
+    text = part.lower()
+    if len(text) != len(part):  # lower() changed offsets; don't guess
+        return None
+    n = len(text)
+    for start in range(n):
+        if start and _is_word(text[start - 1]):
+            continue
+        node = _INSTITUTION_TRIE
+        found = None
+        for end in range(start, n):
+            node = node.get(text[end])
+            if node is None:
+                break
+            if "" in node and (end + 1 == n or not _is_word(text[end + 1])):
+                found = (node[""], start, end + 1)
+        if found:
+            return found
+    return None
+
 
+def _split_degree(part: str) -> tuple[str, str | None]:
+    """Split *part* at its first degree token: (text before it, degree)."""
+    for m in _WORD_RE.finditer(part):
+        if m.group() in _DEGREES:
+            return part[:m.start()], m.group()
+    return part, None
 
-def _parse_education(edu_str: str) -> list[Education]:
-    """Best-effort parse of the freeform education strings."""
+
+@lru_cache(maxsize=256)
+def _parse_education(edu_str: str) -> tuple[tuple[str, str | None, int | None], ...]:
+    """
+    Best-effort parse of the freeform education strings.
+
+    Known institutions are picked out with a trie walk and reported under
+    their canonical name; degree and year come from the rest of the entry.
+    Unknown institutions fall back to "everything before the degree".
+
+    Cached — the same strings recur across co-founders — so the result is
+    plain ``(institution, degree, year)`` tuples; callers build the models.
+    """
     if edu_str == "—" or not edu_str:
-        return []
+        return ()
     entries = []
     for part in edu_str.split(","):
         part = part.strip()
-        # Try to extract year
-        year_match = re.search(r"\b(19|20)\d{2}\b", part)
-        year = int(year_match.group()) if year_match else None
-        # Try to extract institution
-        institution = re.sub(r"\b(BTech|MTech|BE|MBA|MS|BSc|BA)\b.*", "", part).strip()
-        # Try to extract degree
-        degree_match = re.search(r"\b(BTech|MTech|BE|MBA|MS|BSc|BA)\b", part)
-        degree = degree_match.group() if degree_match else None
+        match = _match_institution(part)
+        if match:
+            institution, start, end = match
+            _, degree = _split_degree(f"{part[:start]} {part[end:]}")
+        else:
+            institution, degree = _split_degree(part)
+            institution = institution.strip()
         if institution:
-            entries.append(Education(institution=institution, degree=degree, year=year))
-    return entries
+            entries.append((institution, degree, _find_year(part)))
+    return tuple(entries)
 
 
-def _parse_work(work_str: str) -> list[WorkExperience]:
-    """Best-effort parse of the freeform work strings."""
+@lru_cache(maxsize=256)
+def _parse_work(work_str: str) -> tuple[str, ...]:
+    """Best-effort parse of the freeform work strings (cached, see above)."""
     if work_str == "—" or not work_str:
-        return []
+        return ()
     entries = []
     for part in work_str.split(","):
         part = part.strip()
         if part:
-            entries.append(WorkExperience(company=part))
-    return entries
+            entries.append(part)
+    return tuple(entries)
+
+
+_CompanyRow = namedtuple("_CompanyRow", "id name founders")
+_FounderRow = namedtuple("_FounderRow", "id name company education work tags")
 
 
 def load_legacy_data() -> tuple[list[Company], list[Founder]]:
     """
     Load the hardcoded verified dataset, returning (companies, founders).
+
+    The matrix is parsed once per process; each call builds fresh model
+    instances from it, so callers may mutate what they get back.
     """
-    companies_map: dict[str, Company] = {}
-    founders: list[Founder] = []
+    company_rows, founder_rows = _parse_legacy_rows()
+    companies = [
+        Company(
+            id=c.id,
+            name=c.name,
+            sector=_FINTECH_SECTOR,
+            country=_INDIA,
+            founders=list(c.founders),
+            source=_MANUAL,
+        )
+        for c in company_rows
+    ]
+    founders = [
+        Founder(
+            id=f.id,
+            name=f.name,
+            companies=[f.company],
+            education=[
+                Education(institution=institution, degree=degree, year=year)
+                for institution, degree, year in f.education
+            ],
+            work_history=[WorkExperience(company=company) for company in f.work],
+            source=_MANUAL,
+            verified=True,
+            tags=list(f.tags),
+        )
+        for f in founder_rows
+    ]
+    return companies, founders
+
+
+@lru_cache(maxsize=1)
+def _parse_legacy_rows() -> tuple[tuple[_CompanyRow, ...], tuple[_FounderRow, ...]]:
+    company_names: dict[str, str] = {}
+    company_founders: dict[str, list[str]] = {}
+    founders: list[_FounderRow] = []
+    linked: set[tuple[str, str]] = set()  # (founder slug, company slug)
 
     for row in _RAW_MATRIX:
         # Company
-        company_name = row["company"].replace(" (CEO)", "")
+        company_name = row.company
+        if _CEO_SUFFIX in company_name:
+            company_name = company_name.replace(_CEO_SUFFIX, "")
         company_slug = _slug(company_name)
-        if company_slug not in companies_map:
-            companies_map[company_slug] = Company(
-                id=company_slug,
-                name=company_name,
-                sector="FinTech",
-                country="India",
-                source=DataSource.MANUAL,
-            )
+        if company_slug not in company_names:
+            company_names[company_slug] = company_name
+            company_founders[company_slug] = []
 
         # Founder
-        founder_slug = _slug(f"{row['name']}-{company_slug}")
-        founder = Founder(
-            id=founder_slug,
-            name=row["name"],
-            companies=[company_slug],
-            education=_parse_education(row["edu"]),
-            work_history=_parse_work(row["work"]),
-            source=DataSource.MANUAL,
-            verified=True,
-            tags=row.get("tags", []),
-        )
-        founders.append(founder)
+        founder_slug = _slug(f"{row.name}-{company_slug}")
+        founders.append(_FounderRow(
+            founder_slug,
+            row.name,
+            company_slug,
+            _parse_education(row.edu),
+            _parse_work(row.work),
+            row.tags,
+        ))
 
         # Link founder to company
-        if founder_slug not in companies_map[company_slug].founders:
-            companies_map[company_slug].founders.append(founder_slug)
+        key = (founder_slug, company_slug)
+        if key not in linked:
+            linked.add(key)
+            company_founders[company_slug].append(founder_slug)
 
-    return list(companies_map.values()), founders
+    companies = tuple(
+        _CompanyRow(slug, name, tuple(company_founders[slug]))
+        for slug, name in company_names.items()
+    )
+    return companies, tuple(founders)
@@ -1,18 +1,19 @@
 """
 Core data models for companies, founders, and network relationships.
 
-Uses Pydantic for validation — these models are the canonical internal
-representation that every stage of the pipeline reads/writes.
+These slotted dataclasses are the canonical internal representation that
+every stage of the pipeline reads/writes. Construction does no validation;
+external data (snapshots on disk) is validated once at the I/O boundary
+with ``pydantic.TypeAdapter``, which understands dataclasses natively.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field
-
 
 # ------------------------------------------------------------------
 # Enums
@@ -38,41 +39,46 @@ class RelationshipType(str, Enum):
 # Core models
 # ------------------------------------------------------------------
 
-class Education(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Education:
     institution: str
     degree: Optional[str] = None
     field: Optional[str] = None
     year: Optional[int] = None
 
 
-class WorkExperience(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class WorkExperience:
     company: str
     role: Optional[str] = None
     start_year: Optional[int] = None
     end_year: Optional[int] = None
 
 
-class Founder(BaseModel):
-    id: str = Field(description="Unique slug: lowercase-name-company")
+@dataclass(slots=True, kw_only=True)
+class Founder:
+    id: str  # Unique slug: lowercase-name-company
     name: str
-    companies: list[str] = Field(default_factory=list)
-    education: list[Education] = Field(default_factory=list)
-    work_history: list[WorkExperience] = Field(default_factory=list)
+    companies: list[str] = field(default_factory=list)
+    education: list[Education] = field(default_factory=list)
+    work_history: list[WorkExperience] = field(default_factory=list)
     linkedin_url: Optional[str] = None
     source: DataSource = DataSource.MANUAL
     verified: bool = False
-    tags: list[str] = Field(default_factory=list)
+    tags: list[str] = field(default_factory=list)
 
 
-class FundingRound(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class FundingRound:
     round_type: str  # seed, series_a, etc.
     amount_usd: Optional[int] = None
     date: Optional[str] = None
-    investors: list[str] = Field(default_factory=list)
+    investors: list[str] = field(default_factory=list)
 
 
-class Company(BaseModel):
-    id: str = Field(description="Unique slug: lowercase-name")
+@dataclass(slots=True, kw_only=True)
+class Company:
+    id: str  # Unique slug: lowercase-name
     name: str
     domain: Optional[str] = None
     sector: str = ""
@@ -83,13 +89,14 @@ class Company(BaseModel):
     total_funding_usd: Optional[int] = None
     valuation_usd: Optional[int] = None
     employee_count: Optional[int] = None
-    founders: list[str] = Field(default_factory=list, description="Founder IDs")
-    funding_rounds: list[FundingRound] = Field(default_factory=list)
+    founders: list[str] = field(default_factory=list)  # Founder IDs
+    funding_rounds: list[FundingRound] = field(default_factory=list)
     source: DataSource = DataSource.MANUAL
     tracxn_id: Optional[str] = None
 
 
-class NetworkEdge(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class NetworkEdge:
     """An edge in the founder network graph."""
     source_id: str
     target_id: str
@@ -98,11 +105,12 @@ class NetworkEdge(BaseModel):
     context: Optional[str] = None  # e.g. "IIT Delhi 2004"
 
 
-class NetworkSnapshot(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class NetworkSnapshot:
     """A point-in-time snapshot of the entire dataset."""
-    generated_at: datetime = Field(default_factory=datetime.utcnow)
+    generated_at: datetime = field(default_factory=datetime.utcnow)
     sector: str
-    companies: list[Company] = Field(default_factory=list)
-    founders: list[Founder] = Field(default_factory=list)
-    edges: list[NetworkEdge] = Field(default_factory=list)
-    metadata: dict = Field(default_factory=dict)
+    companies: list[Company] = field(default_factory=list)
+    founders: list[Founder] = field(default_factory=list)
+    edges: list[NetworkEdge] = field(default_factory=list)
+    metadata: dict = field(default_factory=dict)
@@ -19,18 +19,30 @@ Requires TRACXN_ACCESS_TOKEN env var (or pass token directly).
 from __future__ import annotations
 
 import os
-import time
 import logging
-from typing import Any
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Iterator
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
+try:
+    from requests_cache import CachedSession
+except ImportError:  # pragma: no cover - optional dependency
+    CachedSession = None
+
 load_dotenv()
 log = logging.getLogger(__name__)
 
 PLAYGROUND_BASE = "https://platform.tracxn.com/api/2.2/playground"
 MAX_PER_PAGE = 20  # Tracxn hard limit
+PAGE_WORKERS = 4  # concurrent page requests per paginated search
+REQUEST_TIMEOUT = 30  # seconds
+CACHE_TTL = 3600  # seconds; responses change on the order of hours/days
 
 
 class TracxnAPIError(Exception):
@@ -42,6 +54,12 @@ class TracxnAPIError(Exception):
         super().__init__(f"Tracxn API {status}: {detail}")
 
 
+def _record_domains(record: dict) -> list[str]:
+    """The domains a company record lists (``domain``/``website``, str or list)."""
+    domains = record.get("domain") or record.get("website") or []
+    return [domains] if isinstance(domains, str) else domains
+
+
 class TracxnClient:
     """Thin wrapper around the Tracxn Playground REST API v2.2."""
 
@@ -50,6 +68,9 @@ class TracxnClient:
         token: str | None = None,
         base_url: str | None = None,
         max_retries: int = 4,
+        page_workers: int = PAGE_WORKERS,
+        cache_path: str | None = None,
+        cache_ttl: int = CACHE_TTL,
     ):
         self.token = token or os.getenv("TRACXN_ACCESS_TOKEN", "")
         if not self.token:
@@ -61,7 +82,28 @@ class TracxnClient:
             base_url or os.getenv("TRACXN_API_BASE", PLAYGROUND_BASE)
         ).rstrip("/")
         self.max_retries = max_retries
-        self._session = requests.Session()
+        self.page_workers = max(1, page_workers)
+        self._session = self._make_session(
+            cache_path or os.getenv("TRACXN_HTTP_CACHE"), cache_ttl
+        )
+        # Keep-alive pool large enough for concurrent page fetches; urllib3
+        # retries network errors and 429/5xx with exponential back-off,
+        # honouring Retry-After. Every endpoint is a read, so POST is retried.
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=1,
+            status_forcelist=(429, 502, 503, 504),
+            allowed_methods=frozenset({"GET", "POST"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=max(10, self.page_workers),
+            max_retries=retry,
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
         self._session.headers.update(
             {
                 "accesstoken": self.token,  # lowercase per Playground spec
@@ -69,41 +111,50 @@ class TracxnClient:
             }
         )
 
+    @staticmethod
+    def _make_session(cache_path: str | None, cache_ttl: int) -> requests.Session:
+        """
+        Plain session, or — when a cache path is configured and requests-cache
+        is installed — an SQLite-backed CachedSession keyed on URL + body, so
+        repeated development runs replay identical searches from disk.
+
+        The ``accesstoken`` header is an ignored parameter: it is left out of
+        the cache key and redacted from the stored request, so the API token
+        never lands in the cache file.
+        """
+        if not cache_path:
+            return requests.Session()
+        if CachedSession is None:
+            log.warning("TRACXN_HTTP_CACHE set but requests-cache is not installed")
+            return requests.Session()
+        return CachedSession(
+            cache_path,
+            backend="sqlite",
+            expire_after=cache_ttl,
+            allowable_methods=("GET", "POST"),
+            match_headers=False,
+            ignored_parameters=["accesstoken"],
+        )
+
     # ------------------------------------------------------------------
-    # Low-level request with retry + exponential back-off
+    # Low-level request (retry + back-off live in the mounted adapter)
     # ------------------------------------------------------------------
 
     def _request(self, method: str, path: str, **kwargs: Any) -> dict:
         url = f"{self.base}/{path.lstrip('/')}"
-        attempt = 0
-        while True:
-            try:
-                log.debug("→ %s %s", method, url)
-                resp = self._session.request(method, url, **kwargs)
-            except requests.RequestException as exc:
-                attempt += 1
-                if attempt > self.max_retries:
-                    raise
-                wait = 2**attempt
-                log.warning("Network error (%s), retrying in %ss…", exc, wait)
-                time.sleep(wait)
-                continue
-
-            if resp.status_code == 429:
-                attempt += 1
-                if attempt > self.max_retries:
-                    raise TracxnAPIError(429, "Rate limited — max retries exceeded")
-                wait = 2**attempt
-                log.warning("Rate limited, retrying in %ss…", wait)
-                time.sleep(wait)
-                continue
-
-            if resp.status_code >= 400:
-                raise TracxnAPIError(resp.status_code, resp.text[:500])
-
-            return resp.json()
-
-    def _post(self, path: str, payload: dict) -> dict:
+        log.debug("→ %s %s", method, url)
+        resp = self._session.request(method, url, timeout=REQUEST_TIMEOUT, **kwargs)
+
+        if resp.status_code == 429:
+            raise TracxnAPIError(429, "Rate limited — max retries exceeded")
+        if resp.status_code >= 400:
+            raise TracxnAPIError(resp.status_code, resp.text[:500])
+
+        return resp.json()
+
+    def _post(self, path: str, payload: dict | bytes) -> dict:
+        if isinstance(payload, bytes):
+            return self._request("POST", path, data=payload)
         return self._request("POST", path, json=payload)
 
     def _get(self, path: str, params: dict | None = None) -> dict:
@@ -113,36 +164,87 @@ class TracxnClient:
     # Pagination helper (Playground uses "size" / "from")
     # ------------------------------------------------------------------
 
+    def _fetch_page(
+        self, path: str, prefix: bytes, offset: int, size: int
+    ) -> tuple[list[dict], dict]:
+        """One page: (items, the dict holding any total/hasMore fields)."""
+        data = self._post(path, b'%s"size":%d,"from":%d}' % (prefix, size, offset))
+
+        # Response may nest items under "result", "items", or at top level
+        items = data.get("result", data.get("items", []))
+        if isinstance(items, dict):
+            # Some endpoints return {"result": {"items": [...]}}
+            data = items
+            items = items.get("items", [])
+        return items, data
+
+    def _iter_paginated(self, path: str, payload: dict, limit: int = 100) -> Iterator[dict]:
+        """
+        Yield up to *limit* results, handling Tracxn's 20-per-page cap.
+
+        The first page is fetched on its own; if it comes back full, the
+        remaining pages are requested concurrently over the pooled session,
+        at most ``page_workers`` in flight, and yielded in offset order.
+        A short or empty page stops further requests. A ``total``/``hasMore``
+        in the first response bounds the page count, so a result set ending
+        on a page boundary costs no extra empty request. Closing the
+        generator early cancels pages not yet requested.
+        """
+        if limit <= 0:
+            return
+        start = payload.get("from", 0)
+        # Encode the filter once; each page only splices in size/from
+        body = {k: v for k, v in payload.items() if k not in ("size", "from")}
+        prefix = orjson.dumps(body)[:-1] + (b"," if body else b"")
+        first_size = min(MAX_PER_PAGE, limit)
+        items, meta = self._fetch_page(path, prefix, start, first_size)
+        yield from items[:limit]
+        if len(items) < first_size or len(items) >= limit:
+            return  # single page, or a short (last) page
+        if meta.get("hasMore") is False:
+            return
+
+        end = start + limit
+        total = meta.get("total")
+        if isinstance(total, int):
+            end = min(end, total)
+        pages = iter([
+            (offset, min(MAX_PER_PAGE, end - offset))
+            for offset in range(start + first_size, end, MAX_PER_PAGE)
+        ])
+        remaining = limit - len(items)
+        pool = ThreadPoolExecutor(max_workers=self.page_workers)
+        pending: deque[tuple[int, Future]] = deque()
+
+        def submit_next() -> None:
+            page = next(pages, None)
+            if page is not None:
+                offset, size = page
+                pending.append((size, pool.submit(self._fetch_page, path, prefix, offset, size)))
+
+        try:
+            for _ in range(self.page_workers):
+                submit_next()
+            while pending:
+                size, future = pending.popleft()
+                items = future.result()[0]
+                yield from items[:remaining]
+                remaining -= len(items)
+                if len(items) < size or remaining <= 0:
+                    return  # last page: stop submitting
+                submit_next()
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
     def _paginate(self, path: str, payload: dict, limit: int = 100) -> list[dict]:
-        """Fetch up to *limit* results, handling Tracxn's 20-per-page cap."""
-        results: list[dict] = []
-        offset = payload.get("from", 0)
-        while len(results) < limit:
-            batch_size = min(MAX_PER_PAGE, limit - len(results))
-            payload["size"] = batch_size
-            payload["from"] = offset
-            data = self._post(path, payload)
-
-            # Response may nest items under "result", "items", or at top level
-            items = data.get("result", data.get("items", []))
-            if isinstance(items, dict):
-                # Some endpoints return {"result": {"items": [...]}}
-                items = items.get("items", [])
-            if not items:
-                break
-
-            results.extend(items)
-            offset += len(items)
-            if len(items) < batch_size:
-                break  # last page
-
-        return results[:limit]
+        """List form of _iter_paginated."""
+        return list(self._iter_paginated(path, payload, limit))
 
     # ------------------------------------------------------------------
     # Company endpoints
     # ------------------------------------------------------------------
 
-    def search_companies(
+    def iter_companies(
         self,
         *,
         sector: str | None = None,
@@ -153,9 +255,9 @@ class TracxnClient:
         founded_after: int | None = None,
         founded_before: int | None = None,
         limit: int = 100,
-    ) -> list[dict]:
+    ) -> Iterator[dict]:
         """
-        Search companies with filters.
+        Search companies with filters, yielding results page by page.
 
         Playground uses "feedName" (list) for sector filtering.
         """
@@ -182,7 +284,11 @@ class TracxnClient:
             filters["yearFounded"] = year_range
 
         payload: dict[str, Any] = {"filter": filters}
-        return self._paginate("companies", payload, limit=limit)
+        return self._iter_paginated("companies", payload, limit=limit)
+
+    def search_companies(self, **filters: Any) -> list[dict]:
+        """Search companies with filters (list form of iter_companies)."""
+        return list(self.iter_companies(**filters))
 
     def search_companies_by_name(self, name: str, limit: int = 20) -> list[dict]:
         """Name-based company search."""
@@ -200,6 +306,53 @@ class TracxnClient:
         """
         return self._post("companies", {"filter": {"domain": [domain]}})
 
+    def company_lookup_many(self, domains: list[str]) -> dict[str, dict]:
+        """
+        Batched company_lookup: one request per MAX_PER_PAGE domains, sent
+        concurrently. Returns {domain: company record} for every requested
+        domain that a returned record lists (records carry ``domain`` as a
+        string or a list); unmatched domains are absent.
+
+        A chunk whose first page comes back full (several records for one
+        domain) is paginated until every domain in it has matched or the
+        results run out. A chunk whose requests fail is logged and skipped;
+        the other chunks still count.
+        """
+        wanted = list(dict.fromkeys(domains))
+        chunks = [wanted[i:i + MAX_PER_PAGE] for i in range(0, len(wanted), MAX_PER_PAGE)]
+        if not chunks:
+            return {}
+
+        def lookup(chunk: list[str]) -> list[dict]:
+            unmatched = set(chunk)
+            records: list[dict] = []
+            limit = len(chunk) * MAX_PER_PAGE
+            pages = self._iter_paginated("companies", {"filter": {"domain": chunk}}, limit=limit)
+            try:
+                for record in pages:
+                    records.append(record)
+                    unmatched.difference_update(_record_domains(record))
+                    if not unmatched:
+                        break
+            except (TracxnAPIError, requests.RequestException, ValueError) as e:
+                log.warning("Lookup failed for %s: %s", ", ".join(chunk), e)
+                return []
+            finally:
+                pages.close()
+            if unmatched and len(records) >= limit:
+                log.warning("Lookup hit %d records; unmatched: %s", limit, ", ".join(sorted(unmatched)))
+            return records
+
+        wanted_set = set(wanted)
+        found: dict[str, dict] = {}
+        with ThreadPoolExecutor(max_workers=min(self.page_workers, len(chunks))) as pool:
+            for records in pool.map(lookup, chunks):
+                for record in records:
+                    for d in _record_domains(record):
+                        if d in wanted_set:
+                            found.setdefault(d, record)
+        return found
+
     def get_funded_companies(
         self,
         min_amount: int = 0,
@@ -12,12 +12,13 @@ This is the "E" and "T" in a lightweight ETL pipeline:
 
 from __future__ import annotations
 
-import json
 import logging
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from pipeline.tracxn.client import TracxnClient
 from pipeline.tracxn.normaliser import (
     normalise_company,
@@ -41,9 +42,17 @@ def _ensure_dirs() -> None:
     PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
 
 
+_JSONL_OPTS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+
+
 def _write_json(path: Path, data: Any) -> None:
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2, default=str)
+    # orjson serialises dataclasses, enums and datetimes natively; naive
+    # timestamps come from utcnow() so they are tagged as UTC.
+    path.write_bytes(orjson.dumps(
+        data,
+        default=str,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS,
+    ))
     log.info("Wrote %s", path)
 
 
@@ -70,8 +79,12 @@ class DataFetcher:
         sector = config.get("sector", "Unknown")
         log.info("Fetching sector: %s", sector)
 
-        # 1. Search companies
-        raw_companies = self.client.search_companies(
+        # 1. Search companies and 2. normalise them as pages stream in; the
+        # raw records go straight to a JSON Lines file rather than being
+        # held as one list
+        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        raw_path = RAW_DIR / f"{sector.lower()}_{timestamp}_companies.jsonl"
+        raw_companies = self.client.iter_companies(
             sector=sector,
             country=config.get("country"),
             city=config.get("city"),
@@ -81,47 +94,49 @@ class DataFetcher:
             founded_before=config.get("founded_before"),
             limit=config.get("limit", 100),
         )
-        log.info("Fetched %d raw companies", len(raw_companies))
-
-        # Save raw data
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        _write_json(
-            RAW_DIR / f"{sector.lower()}_{timestamp}_companies.json",
-            raw_companies,
-        )
 
-        # 2. Normalise companies
         companies: list[Company] = []
         all_founders: list[Founder] = []
         seen_founders: set[str] = set()
 
-        for raw in raw_companies:
-            company = normalise_company(raw)
-            companies.append(company)
-
-            # Extract founders from the company's people data
-            for person in raw.get("people", raw.get("founders", [])):
-                if isinstance(person, dict):
-                    founder = normalise_founder(person, company.id)
-                    if founder.id not in seen_founders:
-                        seen_founders.add(founder.id)
-                        all_founders.append(founder)
-
-        # 3. Optionally enrich via individual company lookups
+        raw_count = 0
+        with open(raw_path, "wb") as raw_out:
+            for raw in raw_companies:
+                raw_out.write(orjson.dumps(raw, default=str, option=_JSONL_OPTS))
+                raw_count += 1
+
+                company = normalise_company(raw)
+                companies.append(company)
+
+                # Extract founders from the company's people data
+                for person in raw.get("people", raw.get("founders", [])):
+                    if isinstance(person, dict):
+                        # Dedupe on the emitted id: names that differ only in
+                        # case or punctuation slug to the same founder
+                        founder = normalise_founder(person, company.id)
+                        if founder.id not in seen_founders:
+                            seen_founders.add(founder.id)
+                            all_founders.append(founder)
+        log.info("Fetched %d raw companies", raw_count)
+        log.info("Wrote %s", raw_path)
+
+        # 3. Optionally enrich via batched company lookups (one request per
+        # 20 domains) — the Tracxn domain filter accepts a list
         if config.get("enrich_domains"):
+            domains = [c.domain for c in companies if c.domain]
+            # Failed chunks are logged and skipped inside company_lookup_many
+            details = self.client.company_lookup_many(domains)
             for company in companies:
-                if company.domain:
-                    try:
-                        detail = self.client.company_lookup(company.domain)
-                        # Merge any additional founder data
-                        for person in detail.get("people", detail.get("founders", [])):
-                            if isinstance(person, dict):
-                                f = normalise_founder(person, company.id)
-                                if f.id not in seen_founders:
-                                    seen_founders.add(f.id)
-                                    all_founders.append(f)
-                    except Exception:
-                        log.warning("Lookup failed for %s", company.domain)
+                detail = details.get(company.domain)
+                if detail is None:
+                    continue
+                # Merge any additional founder data
+                for person in detail.get("people", detail.get("founders", [])):
+                    if isinstance(person, dict):
+                        founder = normalise_founder(person, company.id)
+                        if founder.id not in seen_founders:
+                            seen_founders.add(founder.id)
+                            all_founders.append(founder)
 
         log.info("Normalised %d companies, %d founders", len(companies), len(all_founders))
 
@@ -133,14 +148,14 @@ class DataFetcher:
             metadata={
                 "config": config,
                 "fetched_at": timestamp,
-                "raw_count": len(raw_companies),
+                "raw_count": raw_count,
             },
         )
 
         # 5. Write processed data
         _write_json(
             PROCESSED_DIR / f"{sector.lower()}_{timestamp}_snapshot.json",
-            snapshot.model_dump(),
+            snapshot,
         )
 
         return snapshot
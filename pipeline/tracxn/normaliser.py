@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import re
 import logging
+from functools import lru_cache
 from typing import Any
 
 from pipeline.models.schema import (
@@ -29,15 +30,81 @@ from pipeline.models.schema import (
 
 log = logging.getLogger(__name__)
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+# Byte -> slug byte: a-z/0-9 kept, A-Z lower-cased, everything else "-"
+_SLUG_BYTES = bytes(
+    c + 32 if 65 <= c <= 90 else c if 97 <= c <= 122 or 48 <= c <= 57 else 45
+    for c in range(256)
+)
+
 
+@lru_cache(maxsize=65536)
 def _slug(text: str) -> str:
-    """Convert a string to a URL-safe slug."""
-    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+    """Convert a string to a URL-safe slug (memoised — names recur)."""
+    if not text.isascii():
+        # Non-ASCII can lower-case to ASCII letters; keep the exact path
+        return _SLUG_RE.sub("-", text.lower()).strip("-")
+    b = text.encode("ascii").translate(_SLUG_BYTES)
+    # Collapse runs of "-" and trim the ends
+    return b"-".join(filter(None, b.split(b"-"))).decode("ascii")
+
+
+def _founder_slug(name: str, company_slug: str) -> str:
+    """
+    Same result as ``_slug(f"{name}-{company_slug}")`` for an already
+    slugged *company_slug*, without re-scanning the company part.
+    """
+    n = _slug(name)
+    return f"{n}-{company_slug}" if n else company_slug
+
+
+# Nested field paths, pre-split once
+_TOTAL_EQUITY_USD = ("totalEquityFunding", "amount", "USD", "value")
+_TOTAL_FUNDING_USD = ("totalFunding", "amount", "USD", "value")
+_VALUATION_USD = ("latestValuation", "amount", "USD", "value")
+_AMOUNT_USD = ("amount", "USD", "value")
+
 
+# Flat fields Tracxn reports under several names, in preference order
+_FIELD_ALIASES: dict[str, tuple[str, ...]] = {
+    "name": ("name", "companyName"),
+    "founded": ("foundedYear", "yearFounded"),
+    "sector": ("sector", "primarySector"),
+    "total_funding": ("totalFundingAmountUSD", "totalFunding", "totalFundingAmount"),
+    "valuation": ("valuation", "latestValuation"),
+    "domain": ("domain", "website"),
+    "city": ("hqCity", "city"),
+    "country": ("hqCountry", "country"),
+    "tracxn_id": ("id", "tracxnId"),
+    "round_amount": ("amount", "amountUSD"),
+    "round_date": ("date", "announcedDate"),
+    "person_name": ("name", "fullName"),
+    "linkedin": ("linkedinUrl", "linkedin"),
+}
 
-def _deep_get(d: dict, path: str, default: Any = None) -> Any:
-    """Safely traverse nested dicts via dot-separated path."""
-    keys = path.split(".")
+
+def _first(raw: dict, field: str, default: Any = None) -> Any:
+    """
+    First truthy value among *field*'s aliases — the same result as
+    ``raw.get(a) or raw.get(b) or raw.get(last, default)``.
+    """
+    get = raw.get
+    for key in _FIELD_ALIASES[field]:
+        value = get(key)
+        if value:
+            return value
+    return get(key, default)
+
+
+def _as_int(value: Any) -> int | None:
+    """``int(value)`` for truthy values, None otherwise; ints pass straight through."""
+    if type(value) is int:
+        return value or None
+    return int(value) if value else None
+
+
+def _deep_get(d: dict, keys: tuple[str, ...], default: Any = None) -> Any:
+    """Safely traverse nested dicts along a tuple of keys."""
     for key in keys:
         if isinstance(d, dict):
             d = d.get(key, default)
@@ -52,28 +119,26 @@ def _deep_get(d: dict, path: str, default: Any = None) -> Any:
 
 def normalise_company(raw: dict[str, Any]) -> Company:
     """Map a raw Tracxn Playground company dict to our Company model."""
-    name = raw.get("name") or raw.get("companyName") or "Unknown"
-    founded = raw.get("foundedYear") or raw.get("yearFounded")
+    g = raw.get
+    name = _first(raw, "name") or "Unknown"
+    founded = _first(raw, "founded")
 
     # Funding — Playground nests as totalEquityFunding.amount.USD.value
     total_funding = (
-        _deep_get(raw, "totalEquityFunding.amount.USD.value")
-        or _deep_get(raw, "totalFunding.amount.USD.value")
-        or raw.get("totalFundingAmountUSD")
-        or raw.get("totalFunding")
-        or raw.get("totalFundingAmount")
+        _deep_get(raw, _TOTAL_EQUITY_USD)
+        or _deep_get(raw, _TOTAL_FUNDING_USD)
+        or _first(raw, "total_funding")
     )
 
     # Valuation
     valuation = (
-        _deep_get(raw, "latestValuation.amount.USD.value")
-        or raw.get("valuation")
-        or raw.get("latestValuation")
+        _deep_get(raw, _VALUATION_USD)
+        or _first(raw, "valuation")
     )
 
     # Sector — Playground uses companySectors list
     sector = ""
-    sectors_list = raw.get("companySectors", [])
+    sectors_list = g("companySectors", [])
     if sectors_list and isinstance(sectors_list, list):
         first = sectors_list[0]
         if isinstance(first, dict):
@@ -81,63 +146,59 @@ def normalise_company(raw: dict[str, Any]) -> Company:
         elif isinstance(first, str):
             sector = first
     if not sector:
-        sector = raw.get("sector", raw.get("primarySector", ""))
+        sector = _first(raw, "sector", "")
 
     # Domain — may be string or list
-    domain = raw.get("domain") or raw.get("website")
+    domain = _first(raw, "domain")
     if isinstance(domain, list):
         domain = domain[0] if domain else None
 
     # City / country
-    city = raw.get("hqCity") or raw.get("city")
-    country = raw.get("hqCountry") or raw.get("country", "India")
+    city = _first(raw, "city")
+    country = _first(raw, "country", "India")
 
     # Funding rounds
     rounds: list[FundingRound] = []
-    for r in raw.get("fundingRounds", raw.get("rounds", [])):
-        amount = (
-            _deep_get(r, "amount.USD.value")
-            or r.get("amount")
-            or r.get("amountUSD")
-        )
+    for r in g("fundingRounds", g("rounds", [])):
+        rg = r.get
+        amount = _deep_get(r, _AMOUNT_USD) or _first(r, "round_amount")
+        # Investors are usually {"name": ...} dicts, occasionally bare values
+        investors: list[str] = []
+        for inv in rg("investors", ()):
+            get = getattr(inv, "get", None)
+            investors.append(get("name", inv) if get else str(inv))
         rounds.append(
             FundingRound(
-                round_type=r.get("roundType", r.get("type", "unknown")),
-                amount_usd=int(amount) if amount else None,
-                date=r.get("date") or r.get("announcedDate"),
-                investors=[
-                    inv.get("name", inv) if isinstance(inv, dict) else str(inv)
-                    for inv in r.get("investors", [])
-                ],
+                round_type=rg("roundType", rg("type", "unknown")),
+                amount_usd=_as_int(amount),
+                date=_first(r, "round_date"),
+                investors=investors,
             )
         )
 
-    # Founder / people references
-    founder_names: list[str] = []
-    for p in raw.get("people", raw.get("founders", raw.get("keyPeople", []))):
-        if isinstance(p, dict):
-            pname = p.get("name") or p.get("fullName", "")
-        else:
-            pname = str(p)
+    # Founder / people references, slugged as they are read
+    founder_slugs: list[str] = []
+    for p in g("people", g("founders", g("keyPeople", ()))):
+        pname = _first(p, "person_name", "") if hasattr(p, "get") else str(p)
         if pname:
-            founder_names.append(pname)
+            founder_slugs.append(_slug(pname))
 
     return Company(
         id=_slug(name),
         name=name,
         domain=domain,
         sector=sector,
-        sub_sector=raw.get("subSector"),
+        sub_sector=g("subSector"),
         city=city,
         country=country,
-        founded_year=int(founded) if founded else None,
-        total_funding_usd=int(total_funding) if total_funding else None,
-        valuation_usd=int(valuation) if valuation else None,
-        employee_count=raw.get("employeeCount"),
-        founders=[_slug(n) for n in founder_names],
+        founded_year=_as_int(founded),
+        total_funding_usd=_as_int(total_funding),
+        valuation_usd=_as_int(valuation),
+        employee_count=g("employeeCount"),
+        founders=founder_slugs,
         funding_rounds=rounds,
         source=DataSource.TRACXN,
-        tracxn_id=raw.get("id") or raw.get("tracxnId"),
+        tracxn_id=_first(raw, "tracxn_id"),
     )
 
 
@@ -147,18 +208,20 @@ def normalise_company(raw: dict[str, Any]) -> Company:
 
 def normalise_founder(raw: dict[str, Any], company_slug: str = "") -> Founder:
     """Map a raw Tracxn person/founder dict to our Founder model."""
-    name = raw.get("name") or raw.get("fullName") or "Unknown"
+    g = raw.get
+    name = _first(raw, "person_name") or "Unknown"
 
     # Education
     education: list[Education] = []
-    for ed in raw.get("education", []):
-        if isinstance(ed, dict):
+    for ed in g("education", ()):
+        get = getattr(ed, "get", None)
+        if get is not None:
             education.append(
                 Education(
-                    institution=ed.get("institution", ed.get("school", "")),
-                    degree=ed.get("degree"),
-                    field=ed.get("field", ed.get("fieldOfStudy")),
-                    year=ed.get("year", ed.get("endYear")),
+                    institution=get("institution", get("school", "")),
+                    degree=get("degree"),
+                    field=get("field", get("fieldOfStudy")),
+                    year=get("year", get("endYear")),
                 )
             )
         elif isinstance(ed, str):
@@ -166,14 +229,15 @@ def normalise_founder(raw: dict[str, Any], company_slug: str = "") -> Founder:
 
     # Work history
     work: list[WorkExperience] = []
-    for w in raw.get("workExperience", raw.get("experience", [])):
-        if isinstance(w, dict):
+    for w in g("workExperience", g("experience", ())):
+        get = getattr(w, "get", None)
+        if get is not None:
             work.append(
                 WorkExperience(
-                    company=w.get("company", w.get("organization", "")),
-                    role=w.get("role", w.get("title")),
-                    start_year=w.get("startYear"),
-                    end_year=w.get("endYear"),
+                    company=get("company", get("organization", "")),
+                    role=get("role", get("title")),
+                    start_year=get("startYear"),
+                    end_year=get("endYear"),
                 )
             )
         elif isinstance(w, str):
@@ -182,12 +246,12 @@ def normalise_founder(raw: dict[str, Any], company_slug: str = "") -> Founder:
     companies = [company_slug] if company_slug else []
 
     return Founder(
-        id=_slug(f"{name}-{company_slug}" if company_slug else name),
+        id=_founder_slug(name, company_slug) if company_slug else _slug(name),
         name=name,
         companies=companies,
         education=education,
         work_history=work,
-        linkedin_url=raw.get("linkedinUrl") or raw.get("linkedin"),
+        linkedin_url=_first(raw, "linkedin"),
         source=DataSource.TRACXN,
         verified=False,
     )
@@ -198,11 +262,19 @@ def normalise_founder(raw: dict[str, Any], company_slug: str = "") -> Founder:
 # ------------------------------------------------------------------
 
 def normalise_company_batch(raw_list: list[dict]) -> list[Company]:
-    """Normalise a list of raw company dicts."""
-    results = []
+    """Normalise a list of raw company dicts, dropping any that fail."""
+    # Preallocated; the tail left by skipped records is trimmed once
+    results: list[Company | None] = [None] * len(raw_list)
+    n = 0
     for raw in raw_list:
+        # A nameless record can only become an "Unknown" placeholder
+        if not _first(raw, "name"):
+            log.warning("Skipping company without a name")
+            continue
         try:
-            results.append(normalise_company(raw))
-        except Exception:
-            log.warning("Failed to normalise company: %s", raw.get("name", "?"))
+            results[n] = normalise_company(raw)
+            n += 1
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            log.warning("Failed to normalise company %s: %s", raw.get("name", "?"), e)
+    del results[n:]
     return results
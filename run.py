@@ -20,17 +20,43 @@ Usage:
 
   # Export JSON report
   python run.py report --legacy
+
+  # Profile any command (cProfile -> profile.prof, pyinstrument -> profile.html)
+  python run.py --profile cprofile analyse --legacy
 """
 
 from __future__ import annotations
 
-import json
+import copy
+import importlib.util
+import itertools
 import logging
+import mmap
+import os
+import re
 import sys
+from collections import OrderedDict, deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import click
-import yaml
+import orjson
+
+from pipeline.models.schema import (
+    Company,
+    DataSource,
+    Education,
+    Founder,
+    FundingRound,
+    NetworkSnapshot,
+    WorkExperience,
+)
+
+if TYPE_CHECKING:
+    from pipeline.analysis.network import NetworkAnalyser
 
 logging.basicConfig(
     level=logging.INFO,
@@ -39,101 +65,459 @@ logging.basicConfig(
 log = logging.getLogger("pipeline")
 
 
+_CONFIG_CACHE_SIZE = 32
+# path -> (mtime, size, parsed config), least recently used first
+_config_cache: OrderedDict[str, tuple[float, int, dict]] = OrderedDict()
+
+
 def _load_config(path: str) -> dict:
+    """Parse a YAML config, reusing the parsed dict while the file is unchanged."""
+    st = os.stat(path)
+    cached = _config_cache.get(path)
+    if cached is not None and cached[:2] == (st.st_mtime, st.st_size):
+        _config_cache.move_to_end(path)
+        return copy.deepcopy(cached[2])
+
+    import yaml
+
+    # libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     with open(path) as f:
-        return yaml.safe_load(f)
+        config = yaml.load(f, Loader=loader)
+    _config_cache[path] = (st.st_mtime, st.st_size, config)
+    _config_cache.move_to_end(path)
+    if len(_config_cache) > _CONFIG_CACHE_SIZE:
+        _config_cache.popitem(last=False)
+    return copy.deepcopy(config)
+
+
+_PROCESSED_DIR = Path("data/processed")
+# Below this size a plain read beats setting up a memory map
+_MMAP_MIN_BYTES = 64 * 1024
+# Sector slug from a snapshot file name, e.g. "fintech_20260224_snapshot.json"
+_SNAPSHOT_RE = re.compile(r"^(?P<slug>[^_]*)(?:_.*)?_snapshot\.json$")
+
+# Snapshots are validated when written; --validate (or FN_VALIDATE_SNAPSHOT=1)
+# re-checks them on load
+_VALIDATE_SNAPSHOT = os.environ.get("FN_VALIDATE_SNAPSHOT") == "1"
+# --fast-models: hydrate into msgspec Structs (pipeline.models.fast) instead
+_FAST_MODELS = False
+
+
+@lru_cache(maxsize=None)
+def _type_adapter(tp):
+    """One pydantic TypeAdapter per type — building the validator is the slow part."""
+    from pydantic import TypeAdapter
+
+    return TypeAdapter(tp)
+
+
+def _company_from_dict(c: dict) -> Company:
+    return Company(
+        **{
+            **c,
+            "funding_rounds": [FundingRound(**r) for r in c.get("funding_rounds", ())],
+            "source": DataSource(c.get("source", DataSource.MANUAL)),
+        }
+    )
 
 
-def _load_latest_snapshot(sector: str) -> dict | None:
-    """Load the most recent processed snapshot for a sector."""
-    processed = Path("data/processed")
-    if not processed.exists():
-        return None
-    files = sorted(processed.glob(f"{sector.lower()}*_snapshot.json"), reverse=True)
-    if not files:
-        return None
-    with open(files[0]) as f:
-        return json.load(f)
+def _founder_from_dict(f: dict) -> Founder:
+    return Founder(
+        **{
+            **f,
+            "education": [Education(**e) for e in f.get("education", ())],
+            "work_history": [WorkExperience(**w) for w in f.get("work_history", ())],
+            "source": DataSource(f.get("source", DataSource.MANUAL)),
+        }
+    )
+
 
+def _hydrate(snapshot: bytes | dict) -> tuple[list[Company], list[Founder]]:
+    """
+    Rebuild the Company / Founder lists from a snapshot, given either as
+    raw JSON bytes or already decoded.
+
+    Trusted snapshots go straight into the dataclass constructors; with
+    --validate they go through pydantic — raw bytes in a single
+    validate_json pass, decoded dicts with one TypeAdapter call per list.
+    Every command hydrates through here.  With --fast-models msgspec
+    decodes into the Struct mirrors from ``pipeline.models.fast``.
+    """
+    if _FAST_MODELS:
+        from pipeline.models.fast import decode_snapshot
+
+        decoded = decode_snapshot(snapshot)
+        return decoded.companies, decoded.founders
+    if isinstance(snapshot, bytes):
+        if _VALIDATE_SNAPSHOT:
+            # Single pass from JSON bytes to dataclasses, no intermediate dicts
+            validated = _type_adapter(NetworkSnapshot).validate_json(snapshot)
+            return validated.companies, validated.founders
+        snapshot = orjson.loads(snapshot)
+    companies = snapshot.get("companies", [])
+    founders = snapshot.get("founders", [])
+    if _VALIDATE_SNAPSHOT:
+        return (
+            _type_adapter(list[Company]).validate_python(companies),
+            _type_adapter(list[Founder]).validate_python(founders),
+        )
+    return (
+        [_company_from_dict(c) for c in companies],
+        [_founder_from_dict(f) for f in founders],
+    )
 
-def _discover_all_snapshots() -> dict[str, dict]:
-    """Discover all available processed snapshots, keyed by sector slug."""
-    processed = Path("data/processed")
-    if not processed.exists():
+
+def _newest_snapshots(prefix: str = "", exclude: Iterable[str] = ()) -> dict[str, Path]:
+    """
+    The latest processed snapshot per sector slug, newest first, in one
+    directory pass.  Only file names starting with *prefix* are considered
+    and slugs in *exclude* are skipped.
+
+    "Latest" is the newest modification time, with the file name as the
+    tie-break, so the result does not depend on the name being a sortable
+    timestamp.
+    """
+    skip = set(exclude)
+    newest: dict[str, tuple[float, str]] = {}
+    try:
+        with os.scandir(_PROCESSED_DIR) as it:
+            for entry in it:
+                name = entry.name
+                if not name.startswith(prefix):
+                    continue
+                match = _SNAPSHOT_RE.match(name)
+                if match is None:
+                    continue
+                sector_slug = match["slug"]
+                if sector_slug in skip:
+                    continue
+                key = (entry.stat().st_mtime, name)
+                if sector_slug not in newest or key > newest[sector_slug]:
+                    newest[sector_slug] = key
+    except FileNotFoundError:
         return {}
-    snapshots: dict[str, dict] = {}
-    for f in sorted(processed.glob("*_snapshot.json"), reverse=True):
-        # Extract sector slug from filename (e.g., "fintech_20260224_snapshot.json")
-        parts = f.stem.split("_")
-        sector_slug = parts[0] if parts else f.stem
-        if sector_slug not in snapshots:
-            with open(f) as fh:
-                snapshots[sector_slug] = json.load(fh)
-    return snapshots
+    return {
+        slug: _PROCESSED_DIR / name
+        for slug, (_, name) in sorted(newest.items(), key=lambda kv: kv[1], reverse=True)
+    }
+
+
+def _load_latest_snapshot(sector: str) -> tuple[list[Company], list[Founder], bytes] | None:
+    """
+    Load the companies and founders of the most recent processed snapshot
+    for a sector, along with the snapshot's raw bytes (the analyser cache key).
+    """
+    latest = next(iter(_newest_snapshots(prefix=sector.lower()).values()), None)
+    if latest is None:
+        return None
+    raw = latest.read_bytes()
+    return *_hydrate(raw), raw
+
+
+def _read_json(path: Path) -> Any:
+    """Decode a JSON file, mapping large files rather than copying them into bytes."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_MIN_BYTES:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def _discover_all_snapshots(exclude: Iterable[str] = ()) -> Iterator[tuple[str, dict]]:
+    """
+    Yield ``(sector_slug, snapshot)`` for the latest processed snapshot of
+    each sector, skipping slugs in *exclude*.
+
+    Files are read and decoded a few at a time on a thread pool, so only a
+    bounded number of decoded snapshots are held while the caller works.
+    """
+    latest = _newest_snapshots(exclude=exclude)
+    if not latest:
+        return
+
+    workers = min(8, len(latest))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending: deque[tuple[str, Future]] = deque()
+        for slug, path in latest.items():
+            pending.append((slug, pool.submit(_read_json, path)))
+            if len(pending) >= workers:
+                slug, future = pending.popleft()
+                yield slug, future.result()
+        while pending:
+            slug, future = pending.popleft()
+            yield slug, future.result()
+
+
+def _load_inputs(
+    legacy: bool, config_path: str | None
+) -> tuple[str, list[Company], list[Founder], bytes | None]:
+    """
+    Resolve --legacy / --config to ``(sector_name, companies, founders,
+    snapshot_bytes)``; the bytes are None for the legacy dataset.
+
+    Only the branch that is taken pays for its imports. Exits when neither
+    option is given or no processed snapshot exists.
+    """
+    if legacy:
+        from pipeline.models.legacy import load_legacy_data
+        companies, founders = load_legacy_data()
+        log.info("Loaded legacy data: %d companies, %d founders", len(companies), len(founders))
+        return "Indian FinTech", companies, founders, None
+    if config_path:
+        config = _load_config(config_path)
+        loaded = _load_latest_snapshot(config.get("sector", "unknown"))
+        if loaded is None:
+            log.error("No processed snapshot found. Run 'fetch' first.")
+            sys.exit(1)
+        companies, founders, raw = loaded
+        return config.get("name", config.get("sector", "Unknown")), companies, founders, raw
+    log.error("Specify --legacy or --config")
+    sys.exit(1)
+
+
+# Next to data/processed, which the cached graphs are keyed on
+_ANALYSER_CACHE_DIR = _PROCESSED_DIR.parent / "cache"
+_ANALYSER_CACHE_KEEP = 8
+
+
+def _cached_analyser(
+    companies: list[Company],
+    founders: list[Founder],
+    snapshot_bytes: bytes | None,
+    exact_centrality: bool = False,
+    backend: str = "auto",
+) -> NetworkAnalyser:
+    """
+    A built NetworkAnalyser, unpickled from data/cache when the same
+    snapshot (with the same analysis/model code and --fast-models and
+    --validate settings) has been built before.  Only the newest
+    _ANALYSER_CACHE_KEEP pickles are kept.
+    """
+    import hashlib
+    import pickle
+
+    from pipeline.analysis import network
+    from pipeline.models import schema
+
+    if snapshot_bytes is None:
+        analyser = network.NetworkAnalyser(
+            companies, founders, exact_centrality=exact_centrality, backend=backend
+        )
+        analyser.build_graph()
+        return analyser
+
+    digest = hashlib.blake2b(snapshot_bytes, digest_size=16)
+    # Graph-building or model changes must not reuse stale pickles, and
+    # --fast-models / --validate hydrate different model classes
+    digest.update(Path(network.__file__).read_bytes())
+    digest.update(Path(schema.__file__).read_bytes())
+    fast_src = Path(schema.__file__).with_name("fast.py")
+    if fast_src.exists():
+        digest.update(fast_src.read_bytes())
+    digest.update(f"fast={_FAST_MODELS};validate={_VALIDATE_SNAPSHOT}".encode())
+    path = _ANALYSER_CACHE_DIR / f"analyser_{digest.hexdigest()}.pkl"
+    try:
+        with open(path, "rb") as f:
+            analyser = pickle.load(f)
+        log.info("Loaded cached graph %s", path)
+        # Scoring options and worker count are not part of the cached graph
+        analyser.exact_centrality = exact_centrality
+        analyser.backend = backend
+        analyser.processes = os.cpu_count() or 1
+        return analyser
+    except FileNotFoundError:
+        pass
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, TypeError, OSError) as e:
+        # Truncated files or pickles of renamed/removed classes: rebuild
+        log.warning("Ignoring unreadable graph cache %s: %s", path, e)
+
+    analyser = network.NetworkAnalyser(
+        companies, founders, exact_centrality=exact_centrality, backend=backend
+    )
+    analyser.build_graph()
+    try:
+        _ANALYSER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            pickle.dump(analyser, f, protocol=pickle.HIGHEST_PROTOCOL)
+        _prune_analyser_cache()
+    except OSError as e:
+        log.warning("Could not write graph cache %s: %s", path, e)
+    return analyser
+
+
+def _prune_analyser_cache() -> None:
+    """Keep only the newest _ANALYSER_CACHE_KEEP pickles."""
+    entries = sorted(
+        _ANALYSER_CACHE_DIR.glob("analyser_*.pkl"),
+        key=lambda p: p.stat().st_mtime,
+        reverse=True,
+    )
+    for stale in entries[_ANALYSER_CACHE_KEEP:]:
+        stale.unlink(missing_ok=True)
+
+
+def _iter_sector_datasets(
+    legacy: bool,
+) -> Iterator[tuple[str, list[Company], list[Founder], None]]:
+    """
+    Yield ``(sector_name, companies, founders, None)`` for the multi-sector
+    dashboard: the legacy FinTech set when *legacy* is set, then the latest
+    snapshot of every other sector.  Graphs are built by
+    generate_multi_sector_dashboard, so no analyser is passed.
+    """
+    if legacy:
+        from pipeline.models.legacy import load_legacy_data
+        companies, founders = load_legacy_data()
+        log.info("Loaded legacy FinTech: %d companies, %d founders", len(companies), len(founders))
+        yield "Indian FinTech", companies, founders, None
+
+    # Skip FinTech snapshots when it was already loaded from legacy
+    for slug, snapshot_data in _discover_all_snapshots(("fintech",) if legacy else ()):
+        try:
+            companies, founders = _hydrate(snapshot_data)
+            sector_name = snapshot_data.get("sector", slug.replace("_", " ").title())
+        except Exception as e:
+            log.warning("Skipping snapshot %s: %s", slug, e)
+            continue
+        log.info("Loaded snapshot %s: %d companies, %d founders", slug, len(companies), len(founders))
+        yield sector_name, companies, founders, None
 
 
 # ------------------------------------------------------------------
 # CLI
 # ------------------------------------------------------------------
 
+_centrality_option = click.option(
+    "--approx-centrality/--exact-centrality",
+    "approx_centrality",
+    default=True,
+    help="Sample betweenness sources on large graphs (default) or run full Brandes",
+)
+# analyse --only choices; the last three need the network graph
+_ANALYSE_SECTIONS = ("hubs", "pipelines", "flows", "centrality", "clusters", "insights")
+_GRAPH_SECTIONS = {"centrality", "clusters", "insights"}
+
+_backend_option = click.option(
+    "--graph-backend",
+    type=click.Choice(["auto", "networkx", "igraph", "networkit"]),
+    default="auto",
+    help="Library that scores betweenness (auto: fastest installed)",
+)
+
+
 @click.group()
-def cli():
+@click.option(
+    "--profile",
+    type=click.Choice(["none", "pyinstrument", "cprofile"]),
+    default="none",
+    help="Profile the command (writes profile.html or profile.prof)",
+)
+@click.option(
+    "--validate/--no-validate",
+    default=_VALIDATE_SNAPSHOT,
+    help="Re-validate processed snapshots with pydantic on load (default: trust them)",
+)
+@click.option(
+    "--fast-models",
+    is_flag=True,
+    help="Decode snapshots into msgspec Structs (needs msgspec; overrides --validate)",
+)
+@click.pass_context
+def cli(ctx: click.Context, profile: str, validate: bool, fast_models: bool):
     """Founder Network Analysis Pipeline."""
-    pass
+    global _VALIDATE_SNAPSHOT, _FAST_MODELS
+    _VALIDATE_SNAPSHOT = validate
+    if fast_models and importlib.util.find_spec("msgspec") is None:
+        raise click.UsageError("--fast-models needs msgspec installed")
+    _FAST_MODELS = fast_models
+
+    if profile == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            raise click.UsageError("--profile pyinstrument needs pyinstrument installed")
+        profiler = Profiler()
+        profiler.start()
+
+        def _write():
+            profiler.stop()
+            profiler.write_html("profile.html")
+            log.info("Wrote profile.html")
+
+        ctx.call_on_close(_write)
+    elif profile == "cprofile":
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+        def _write():
+            profiler.disable()
+            profiler.dump_stats("profile.prof")
+            log.info("Wrote profile.prof (open with snakeviz)")
+
+        ctx.call_on_close(_write)
 
 
 @cli.command()
 @click.option("--legacy", is_flag=True, help="Analyse the original hardcoded verified dataset")
 @click.option("--config", "config_path", type=str, help="Path to sector config YAML")
-def analyse(legacy: bool, config_path: str | None):
+@_centrality_option
+@_backend_option
+@click.option(
+    "--only",
+    multiple=True,
+    type=click.Choice(_ANALYSE_SECTIONS),
+    help="Print only these sections (repeatable); default is all",
+)
+def analyse(
+    legacy: bool,
+    config_path: str | None,
+    approx_centrality: bool,
+    graph_backend: str,
+    only: tuple[str, ...],
+):
     """Run network analysis and print results to stdout."""
-    from pipeline.analysis.network import NetworkAnalyser
-
-    if legacy:
-        from pipeline.models.legacy import load_legacy_data
-        companies, founders = load_legacy_data()
-        log.info("Loaded legacy data: %d companies, %d founders", len(companies), len(founders))
-    elif config_path:
-        snapshot_data = _load_latest_snapshot(
-            _load_config(config_path).get("sector", "unknown")
-        )
-        if not snapshot_data:
-            log.error("No processed snapshot found. Run 'fetch' first.")
-            sys.exit(1)
-        from pipeline.models.schema import Company, Founder
-        companies = [Company(**c) for c in snapshot_data["companies"]]
-        founders = [Founder(**f) for f in snapshot_data["founders"]]
+    sections = set(only or _ANALYSE_SECTIONS)
+    _, companies, founders, raw = _load_inputs(legacy, config_path)
+    if sections & _GRAPH_SECTIONS:
+        analyser = _cached_analyser(companies, founders, raw, not approx_centrality, graph_backend)
     else:
-        log.error("Specify --legacy or --config")
-        sys.exit(1)
-
-    analyser = NetworkAnalyser(companies, founders)
-    analyser.build_graph()
+        # Count-based sections only — the graph is never built
+        from pipeline.analysis.network import NetworkAnalyser
+        analyser = NetworkAnalyser(companies, founders)
 
-    click.echo("\n=== EDUCATION HUBS ===")
-    for h in analyser.education_hubs(15):
-        click.echo(f"  {h['institution']:30s}  {h['founder_count']} founders")
+    if "hubs" in sections:
+        click.echo("\n=== EDUCATION HUBS ===")
+        for h in analyser.education_hubs(15):
+            click.echo(f"  {h['institution']:30s}  {h['founder_count']} founders")
 
-    click.echo("\n=== EMPLOYER PIPELINES ===")
-    for p in analyser.employer_pipelines(15):
-        click.echo(f"  {p['employer']:30s}  {p['founder_count']} founders")
+    if "pipelines" in sections:
+        click.echo("\n=== EMPLOYER PIPELINES ===")
+        for p in analyser.employer_pipelines(15):
+            click.echo(f"  {p['employer']:30s}  {p['founder_count']} founders")
 
-    click.echo("\n=== NETWORK CONNECTORS (betweenness centrality) ===")
-    for c in analyser.centrality_rankings(10):
-        click.echo(f"  {c['name']:30s}  centrality={c['centrality']}")
+    if "centrality" in sections:
+        click.echo("\n=== NETWORK CONNECTORS (betweenness centrality) ===")
+        for c in analyser.centrality_rankings(10):
+            click.echo(f"  {c['name']:30s}  centrality={c['centrality']}")
 
-    click.echo("\n=== FOUNDER CLUSTERS ===")
-    for cl in analyser.detect_clusters(3):
-        click.echo(f"  Cluster ({cl['size']} members): {', '.join(cl['members'][:5])}...")
+    if "clusters" in sections:
+        click.echo("\n=== FOUNDER CLUSTERS ===")
+        for cl in analyser.detect_clusters(3):
+            click.echo(f"  Cluster ({cl['size']} members): {', '.join(cl['members'][:5])}...")
 
-    click.echo("\n=== TOP TALENT FLOWS ===")
-    for fl in analyser.founder_to_company_flow()[:10]:
-        click.echo(f"  {fl['from_employer']:20s} -> {fl['to_company']:20s}  ({fl['count']} founders)")
+    if "flows" in sections:
+        click.echo("\n=== TOP TALENT FLOWS ===")
+        for fl in analyser.founder_to_company_flow(10):
+            click.echo(f"  {fl['from_employer']:20s} -> {fl['to_company']:20s}  ({fl['count']} founders)")
 
-    click.echo("\n=== TOP INSIGHTS ===")
-    for ins in analyser.generate_insights()[:10]:
-        click.echo(f"  [{ins.category}] {ins.title}")
-        click.echo(f"    {ins.detail}\n")
+    if "insights" in sections:
+        click.echo("\n=== TOP INSIGHTS ===")
+        for ins in analyser.generate_insights()[:10]:
+            click.echo(f"  [{ins['category']}] {ins['title']}")
+            click.echo(f"    {ins['detail']}\n")
 
 
 @cli.command()
@@ -157,9 +541,17 @@ def fetch(config_path: str):
 @click.option("--config", "config_path", type=str, help="Path to sector config YAML")
 @click.option("--all-sectors", is_flag=True, help="Bundle all available sector data into one dashboard")
 @click.option("--output", "output_name", type=str, help="Output filename")
-def dashboard(legacy: bool, config_path: str | None, all_sectors: bool, output_name: str | None):
+@_centrality_option
+@_backend_option
+def dashboard(
+    legacy: bool,
+    config_path: str | None,
+    all_sectors: bool,
+    output_name: str | None,
+    approx_centrality: bool,
+    graph_backend: str,
+):
     """Generate an HTML dashboard."""
-    from pipeline.analysis.network import NetworkAnalyser
     from pipeline.export.dashboard import (
         generate_dashboard,
         generate_multi_sector_dashboard,
@@ -168,67 +560,28 @@ def dashboard(legacy: bool, config_path: str | None, all_sectors: bool, output_n
     )
 
     if all_sectors:
-        # Multi-sector mode: gather all available data
-        sector_datasets = []
-
-        # Always include legacy as FinTech if --legacy is set
-        if legacy:
-            from pipeline.models.legacy import load_legacy_data
-            companies, founders = load_legacy_data()
-            analyser = NetworkAnalyser(companies, founders)
-            analyser.build_graph()
-            sector_datasets.append(("Indian FinTech", companies, founders, analyser))
-            log.info("Loaded legacy FinTech: %d companies, %d founders", len(companies), len(founders))
-
-        # Discover processed snapshots
-        from pipeline.models.schema import Company, Founder
-        for slug, snapshot_data in _discover_all_snapshots().items():
-            # Skip if we already loaded this sector from legacy
-            if legacy and slug == "fintech":
-                continue
-            try:
-                companies = [Company(**c) for c in snapshot_data.get("companies", [])]
-                founders = [Founder(**f) for f in snapshot_data.get("founders", [])]
-                sector_name = snapshot_data.get("sector", slug.replace("_", " ").title())
-                analyser = NetworkAnalyser(companies, founders)
-                analyser.build_graph()
-                sector_datasets.append((sector_name, companies, founders, analyser))
-                log.info("Loaded snapshot %s: %d companies, %d founders", slug, len(companies), len(founders))
-            except Exception as e:
-                log.warning("Skipping snapshot %s: %s", slug, e)
-
-        if not sector_datasets:
+        # Multi-sector mode: stream every available sector into the
+        # dashboard, which analyses them as they arrive
+        sector_datasets = _iter_sector_datasets(legacy)
+        first = next(sector_datasets, None)
+        if first is None:
             log.error("No sector data available. Use --legacy or run 'fetch' first.")
             sys.exit(1)
+        sector_datasets = itertools.chain((first,), sector_datasets)
+        del first
 
         out = generate_multi_sector_dashboard(
             sector_datasets,
             output_filename=output_name or "multi_sector_dashboard.html",
+            exact_centrality=not approx_centrality,
+            backend=graph_backend,
         )
         click.echo(f"Multi-sector dashboard generated: {out}")
 
     else:
         # Single-sector mode (original behavior)
-        if legacy:
-            from pipeline.models.legacy import load_legacy_data
-            companies, founders = load_legacy_data()
-            sector_name = "Indian FinTech"
-        elif config_path:
-            config = _load_config(config_path)
-            sector_name = config.get("name", config.get("sector", "Unknown"))
-            snapshot_data = _load_latest_snapshot(config.get("sector", "unknown"))
-            if not snapshot_data:
-                log.error("No processed snapshot found. Run 'fetch' first.")
-                sys.exit(1)
-            from pipeline.models.schema import Company, Founder
-            companies = [Company(**c) for c in snapshot_data["companies"]]
-            founders = [Founder(**f) for f in snapshot_data["founders"]]
-        else:
-            log.error("Specify --legacy or --config")
-            sys.exit(1)
-
-        analyser = NetworkAnalyser(companies, founders)
-        analyser.build_graph()
+        sector_name, companies, founders, raw = _load_inputs(legacy, config_path)
+        analyser = _cached_analyser(companies, founders, raw, not approx_centrality, graph_backend)
 
         out = generate_dashboard(sector_name, companies, founders, analyser, output_name)
         click.echo(f"Dashboard generated: {out}")
@@ -238,31 +591,20 @@ def dashboard(legacy: bool, config_path: str | None, all_sectors: bool, output_n
 @click.option("--legacy", is_flag=True, help="Use the original verified dataset")
 @click.option("--config", "config_path", type=str, help="Path to sector config YAML")
 @click.option("--output", "output_name", type=str, help="Output filename")
-def report(legacy: bool, config_path: str | None, output_name: str | None):
+@_centrality_option
+@_backend_option
+def report(
+    legacy: bool,
+    config_path: str | None,
+    output_name: str | None,
+    approx_centrality: bool,
+    graph_backend: str,
+):
     """Export a JSON analysis report."""
-    from pipeline.analysis.network import NetworkAnalyser
     from pipeline.export.dashboard import export_json_report
 
-    if legacy:
-        from pipeline.models.legacy import load_legacy_data
-        companies, founders = load_legacy_data()
-        sector_name = "Indian FinTech"
-    elif config_path:
-        config = _load_config(config_path)
-        sector_name = config.get("name", config.get("sector", "Unknown"))
-        snapshot_data = _load_latest_snapshot(config.get("sector", "unknown"))
-        if not snapshot_data:
-            log.error("No processed snapshot found. Run 'fetch' first.")
-            sys.exit(1)
-        from pipeline.models.schema import Company, Founder
-        companies = [Company(**c) for c in snapshot_data["companies"]]
-        founders = [Founder(**f) for f in snapshot_data["founders"]]
-    else:
-        log.error("Specify --legacy or --config")
-        sys.exit(1)
-
-    analyser = NetworkAnalyser(companies, founders)
-    analyser.build_graph()
+    sector_name, companies, founders, raw = _load_inputs(legacy, config_path)
+    analyser = _cached_analyser(companies, founders, raw, not approx_centrality, graph_backend)
 
     out = export_json_report(sector_name, analyser, output_name)
     click.echo(f"Report exported: {out}")
@@ -271,7 +613,9 @@ def report(legacy: bool, config_path: str | None, output_name: str | None):
 @cli.command()
 @click.option("--config", "config_path", required=True, type=str, help="Path to sector config YAML")
 @click.option("--output", "output_name", type=str, help="Output filename")
-def full(config_path: str, output_name: str | None):
+@_centrality_option
+@_backend_option
+def full(config_path: str, output_name: str | None, approx_centrality: bool, graph_backend: str):
     """Full pipeline: fetch from Tracxn → analyse → generate dashboard."""
     config = _load_config(config_path)
     sector_name = config.get("name", config.get("sector", "Unknown"))
@@ -284,13 +628,29 @@ def full(config_path: str, output_name: str | None):
 
     # Analyse
     from pipeline.analysis.network import NetworkAnalyser
-    analyser = NetworkAnalyser(snapshot.companies, snapshot.founders)
+    analyser = NetworkAnalyser(
+        snapshot.companies,
+        snapshot.founders,
+        exact_centrality=not approx_centrality,
+        backend=graph_backend,
+    )
     analyser.build_graph()
 
-    # Dashboard
-    from pipeline.export.dashboard import generate_dashboard, export_json_report
-    dash = generate_dashboard(sector_name, snapshot.companies, snapshot.founders, analyser, output_name)
-    rpt = export_json_report(sector_name, analyser)
+    # Dashboard + report share one set of results; render and write both at once
+    from pipeline.export.dashboard import generate_dashboard, export_json_report, run_analyses
+    analyses = run_analyses(analyser)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        dash_future = pool.submit(
+            generate_dashboard,
+            sector_name,
+            snapshot.companies,
+            snapshot.founders,
+            analyser,
+            output_name,
+            analyses=analyses,
+        )
+        rpt_future = pool.submit(export_json_report, sector_name, analyser, analyses=analyses)
+        dash, rpt = dash_future.result(), rpt_future.result()
     click.echo(f"Dashboard: {dash}")
     click.echo(f"Report: {rpt}")
 